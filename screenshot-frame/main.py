@@ -1,10 +1,24 @@
 import os
 import asyncio
+import binascii
+import contextvars
+import fnmatch
+import functools
+import hashlib
 import json
 import logging
+import random
+import threading
+import time
+import uuid
 import warnings
-from datetime import datetime
-from aiohttp import web, ClientSession, BasicAuth
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from aiohttp import web, ClientSession, BasicAuth, TCPConnector, WSMsgType
 from pathlib import Path
 
 # Suppress SSL warnings for local network devices
@@ -33,6 +47,11 @@ else:
     ART_PATH = Path('./data/art.jpg')
     
 
+# Raw target responses that are not art (HTML, errors) are kept here for debugging
+DEBUG_RESPONSE_PATH = ART_PATH.with_name('last-response.bin')
+# Chromium profile (HTTP cache, localStorage, service workers) kept across restarts
+BROWSER_PROFILE_DIR = ART_PATH.with_name('chromium-profile')
+
 # Ensure the chosen data directory exists
 try:
     ART_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -40,11 +59,59 @@ except Exception:
     pass
 
 INTERVAL = int(os.environ.get('INTERVAL_SECONDS', os.environ.get('INTERVAL', 300)))
+# Adaptive scheduling: the interval floats between MIN and MAX (both default to INTERVAL = fixed)
+SCHEDULE_MIN_INTERVAL = int(os.environ.get('SCHEDULE_MIN_INTERVAL') or INTERVAL)
+SCHEDULE_MAX_INTERVAL = max(SCHEDULE_MIN_INTERVAL, int(os.environ.get('SCHEDULE_MAX_INTERVAL') or INTERVAL))
+SCHEDULE_BACKOFF_MAX = int(os.environ.get('SCHEDULE_BACKOFF_MAX', '1800'))  # cap for failure backoff in seconds
 SCREENSHOT_WIDTH = int(os.environ.get('SCREENSHOT_WIDTH', '1920'))
 SCREENSHOT_HEIGHT = int(os.environ.get('SCREENSHOT_HEIGHT', '1080'))
 SCREENSHOT_ZOOM = int(os.environ.get('SCREENSHOT_ZOOM', '100'))  # percentage: 100 = 100%, 150 = 150%, etc.
 SCREENSHOT_WAIT = float(os.environ.get('SCREENSHOT_WAIT', '0.0'))  # seconds to wait after network idle (0 = no additional wait)
+SCREENSHOT_READY_JSON = os.environ.get('SCREENSHOT_READY') or ''  # optional JSON list of readiness predicates (replaces waiting for network idle)
+SCREENSHOT_READY_TIMEOUT = float(os.environ.get('SCREENSHOT_READY_TIMEOUT', '10'))  # default seconds each predicate may take
 SCREENSHOT_SKIP_NAVIGATION = os.environ.get('SCREENSHOT_SKIP_NAVIGATION', 'false').lower() in ('1','true','yes')  # Skip page reload, just take new screenshot
+SCREENSHOT_SKIP_UNCHANGED = os.environ.get('SCREENSHOT_SKIP_UNCHANGED', 'true').lower() in ('1','true','yes')  # Skip TV upload when the frame did not change
+SCREENSHOT_CHANGE_THRESHOLD = float(os.environ.get('SCREENSHOT_CHANGE_THRESHOLD', '0.0'))  # percent mean pixel difference below which a frame counts as unchanged (0 = exact match only)
+BROWSER_PAGE_POOL_SIZE = max(1, int(os.environ.get('BROWSER_PAGE_POOL_SIZE', '4')))  # pages kept open in the shared browser
+BROWSER_PERSISTENT_PROFILE = os.environ.get('BROWSER_PERSISTENT_PROFILE', 'true').lower() in ('1','true','yes')  # keep the browser profile in /data
+BROWSER_CACHE_SIZE_MB = max(1, int(os.environ.get('BROWSER_CACHE_SIZE_MB', '100')))  # cap for Chromium's HTTP disk cache
+# Memory watchdog, checked between cycles; pages/the browser are recycled over these limits (0 = no limit)
+BROWSER_WATCHDOG_INTERVAL = int(os.environ.get('BROWSER_WATCHDOG_INTERVAL', '300'))  # seconds between memory samples
+BROWSER_MAX_RSS_MB = int(os.environ.get('BROWSER_MAX_RSS_MB', '0'))  # Chromium process tree resident memory
+PAGE_MAX_HEAP_MB = int(os.environ.get('PAGE_MAX_HEAP_MB', '0'))  # JS heap used by a single page
+PAGE_MAX_AGE_HOURS = float(os.environ.get('PAGE_MAX_AGE_HOURS', '24'))  # reload long-lived (skip navigation) pages
+SCREENSHOT_CAPTURE = (os.environ.get('SCREENSHOT_CAPTURE') or 'cdp').lower()  # cdp (Page.captureScreenshot directly) | pyppeteer
+SCREENSHOT_FORMAT = 'png' if (os.environ.get('SCREENSHOT_FORMAT') or '').lower() == 'png' else 'jpeg'
+SCREENSHOT_QUALITY = min(100, max(1, int(os.environ.get('SCREENSHOT_QUALITY', '85'))))  # JPEG quality of the raw capture
+SCREENSHOT_CLIP = os.environ.get('SCREENSHOT_CLIP') or ''  # optional "x,y,width,height" region in CSS pixels
+SCREENSHOT_OPTIMIZE_FOR_SPEED = os.environ.get('SCREENSHOT_OPTIMIZE_FOR_SPEED', 'true').lower() in ('1','true','yes')  # faster, slightly larger encodes
+# Screencast mode: with skip navigation, Chromium pushes frames on repaint instead of being polled
+SCREENSHOT_SCREENCAST = os.environ.get('SCREENSHOT_SCREENCAST', 'false').lower() in ('1','true','yes')
+SCREENSHOT_SCREENCAST_TRIGGER = os.environ.get('SCREENSHOT_SCREENCAST_TRIGGER', 'false').lower() in ('1','true','yes')  # capture as soon as the page repaints
+
+# Request interception on render pages (all off by default)
+RENDER_BLOCK_TYPES = {t.strip().lower() for t in (os.environ.get('RENDER_BLOCK_TYPES') or '').split(',') if t.strip()}  # e.g. media,font,websocket,analytics
+RENDER_ALLOW_PATTERNS = [p.strip() for p in (os.environ.get('RENDER_ALLOW_PATTERNS') or '').split(',') if p.strip()]  # URL patterns never blocked
+RENDER_DENY_PATTERNS = [p.strip() for p in (os.environ.get('RENDER_DENY_PATTERNS') or '').split(',') if p.strip()]  # URL patterns always blocked
+RENDER_MAX_REQUESTS = int(os.environ.get('RENDER_MAX_REQUESTS', '0'))  # requests allowed per render (0 = unlimited)
+RENDER_MAX_BYTES = int(os.environ.get('RENDER_MAX_BYTES', '0'))  # bytes downloaded per render before further requests are blocked (0 = unlimited)
+RENDER_SLOW_REQUEST_MS = int(os.environ.get('RENDER_SLOW_REQUEST_MS', '2000'))  # requests slower than this are reported in the cycle trace
+
+# Post-processing of every frame before upload (resize + re-encode in a process pool)
+IMAGE_PROCESSING = os.environ.get('IMAGE_PROCESSING', 'false').lower() in ('1','true','yes')
+IMAGE_OUTPUT_WIDTH = int(os.environ.get('IMAGE_OUTPUT_WIDTH', '3840'))  # Frame native resolution
+IMAGE_OUTPUT_HEIGHT = int(os.environ.get('IMAGE_OUTPUT_HEIGHT', '2160'))
+IMAGE_FIT = (os.environ.get('IMAGE_FIT') or 'letterbox').lower()  # letterbox|crop|stretch
+IMAGE_BACKGROUND = os.environ.get('IMAGE_BACKGROUND') or '#000000'  # letterbox bar colour
+IMAGE_SHARPEN = float(os.environ.get('IMAGE_SHARPEN', '0'))  # unsharp mask strength in percent (0 = off)
+IMAGE_CONVERT_SRGB = os.environ.get('IMAGE_CONVERT_SRGB', 'true').lower() in ('1','true','yes')  # convert embedded ICC profiles to sRGB
+IMAGE_JPEG_QUALITY = min(100, max(1, int(os.environ.get('IMAGE_JPEG_QUALITY', '90'))))
+IMAGE_JPEG_SUBSAMPLING = os.environ.get('IMAGE_JPEG_SUBSAMPLING') or '4:4:4'  # 4:4:4 keeps dashboard text crisp; 4:2:0 is smaller
+IMAGE_PROCESS_WORKERS = max(1, int(os.environ.get('IMAGE_PROCESS_WORKERS', '1')))
+# Byte-budget encoding: search JPEG quality (up to IMAGE_JPEG_QUALITY) per target
+IMAGE_MAX_BYTES = int(os.environ.get('IMAGE_MAX_BYTES', '0'))  # upload size budget in bytes (0 = off)
+IMAGE_MIN_SSIM = float(os.environ.get('IMAGE_MIN_SSIM', '0'))  # stop lowering quality at this SSIM, e.g. 0.98 (0 = off)
+IMAGE_MIN_QUALITY = min(100, max(1, int(os.environ.get('IMAGE_MIN_QUALITY', '40'))))  # lowest quality the search may pick
 
 # Logging
 DEBUG_LOGGING = os.environ.get('DEBUG_LOGGING', 'false').lower() in ('1','true','yes')
@@ -59,7 +126,13 @@ TV_PORT = int(os.environ.get('TV_PORT', '8001'))
 TV_MATTE = os.environ.get('TV_MATTE') or None
 TV_SHOW_AFTER_UPLOAD = os.environ.get('TV_SHOW_AFTER_UPLOAD', 'true').lower() in ('1','true','yes')
 TV_UPLOAD_TIMEOUT = int(os.environ.get('TV_UPLOAD_TIMEOUT', '60'))  # seconds (default: 60s)
+TV_TARGETS_JSON = os.environ.get('TV_TARGETS') or ''  # optional JSON list of TVs (overrides TV_IP)
+TV_UPLOAD_CONCURRENCY = max(1, int(os.environ.get('TV_UPLOAD_CONCURRENCY', '4')))  # TVs uploaded in parallel
 TV_DELETION_RETRY_MAX = int(os.environ.get('TV_DELETION_RETRY_MAX', '5'))  # Max retries for deletion (default: 5)
+TV_PING_INTERVAL = int(os.environ.get('TV_PING_INTERVAL', '30'))  # seconds a TV connection may idle before it is pinged
+TV_GC_INTERVAL = int(os.environ.get('TV_GC_INTERVAL', '3600'))  # seconds between orphaned-art reconciliation passes (0 = off)
+TV_GC_BATCH = max(1, int(os.environ.get('TV_GC_BATCH', '10')))  # orphans deleted per TV per pass
+TV_DELETE_CHUNK = max(1, int(os.environ.get('TV_DELETE_CHUNK', '25')))  # content IDs per delete_list request
 TARGET_URL = os.environ.get('TARGET_URL') or ''
 # Target URL auth settings (supports multiple auth types)
 # TARGET_AUTH_TYPE: none|bearer|basic|headers
@@ -71,13 +144,26 @@ TARGET_USERNAME = os.environ.get('TARGET_USERNAME')
 TARGET_PASSWORD = os.environ.get('TARGET_PASSWORD')
 TARGET_HEADERS = os.environ.get('TARGET_HEADERS')  # optional JSON map of headers
 
+# Event-driven captures from Home Assistant state changes (INTERVAL becomes the max staleness)
+TRIGGER_ENTITIES = [e.strip() for e in (os.environ.get('TRIGGER_ENTITIES') or '').split(',') if e.strip()]  # entity IDs or patterns like sensor.*
+TRIGGER_DEBOUNCE = float(os.environ.get('TRIGGER_DEBOUNCE', '2.0'))  # seconds of quiet before a triggered capture
+HA_WEBSOCKET_URL = os.environ.get('HA_WEBSOCKET_URL') or 'ws://supervisor/core/websocket'
+HA_TOKEN = os.environ.get('HA_TOKEN') or os.environ.get('SUPERVISOR_TOKEN') or ''
+
 # Ingress support (Home Assistant Supervisor)
 INGRESS_ENABLED = os.environ.get('INGRESS', 'false').lower() in ('1','true','yes')
 INGRESS_PORT = int(os.environ.get('INGRESS_PORT', '8099'))
 
-# Always replace last art file (hard-coded path for persistence)
+# Legacy single-TV last art file; art IDs are now kept per TV in TV_STATE_FILE
 TV_LAST_ART_FILE = '/data/last-art-id.txt'
-TV_DELETION_RETRY_FILE = '/data/tv-deletion-retry.json'  # Track deletion retries
+TV_DELETION_RETRY_FILE = '/data/tv-deletion-retry.json'  # legacy; imported into TV_STATE_FILE
+TV_STATE_FILE = '/data/state.jsonl'  # journal of retry counters, last art IDs and upload history
+TV_TOKEN_FILE = '/data/tv-token.txt'  # legacy single-TV token; moved to the TV_IP TV's per-TV token file
+
+# Per-cycle trace history (ring buffer, optionally persisted as JSON lines)
+TRACE_HISTORY_SIZE = max(1, int(os.environ.get('TRACE_HISTORY_SIZE', '100')))
+TRACE_PERSIST = os.environ.get('TRACE_PERSIST', 'false').lower() in ('1','true','yes')
+TRACE_HISTORY_FILE = '/data/cycle-history.jsonl'
 
 # MQTT configuration (optional Home Assistant integration)
 MQTT_ENABLED = os.environ.get('MQTT_ENABLED', 'false').lower() in ('1','true','yes')
@@ -87,25 +173,176 @@ MQTT_USERNAME = os.environ.get('MQTT_USERNAME')
 MQTT_PASSWORD = os.environ.get('MQTT_PASSWORD')
 MQTT_TOPIC_BASE = os.environ.get('MQTT_TOPIC_BASE', 'homeassistant')  # Discovery uses homeassistant/ prefix
 
-logger.info('Screenshot to Samsung Frame Addon - Starting')
-if DEBUG_LOGGING:
+
+
+@dataclass(frozen=True)
+class TVTarget:
+    """A Samsung Frame TV that receives each rendered frame."""
+    host: str
+    port: int = TV_PORT
+    matte: str | None = TV_MATTE
+    show: bool = TV_SHOW_AFTER_UPLOAD
+    timeout: int = TV_UPLOAD_TIMEOUT
+    url: str | None = None  # dashboard shown on this TV (defaults to TARGET_URL)
+
+    @property
+    def key(self) -> str:
+        return f'{self.host}:{self.port}'
+
+
+def _parse_tv_targets() -> list[TVTarget]:
+    """Build the list of TVs from ``TV_TARGETS`` or the single ``TV_IP``.
+
+    ``TV_TARGETS`` is a JSON list whose entries are either ``"ip"`` /
+    ``"ip:port"`` strings or objects with ``ip`` (or ``host``) and optional
+    ``port``, ``matte``, ``show``, ``timeout`` and ``url`` keys.  Missing
+    values fall back to the global ``tv_*`` options and ``target_url``.
+    """
+    targets = []
+    if TV_TARGETS_JSON:
+        try:
+            entries = json.loads(TV_TARGETS_JSON)
+            if not isinstance(entries, list):
+                raise ValueError('expected a JSON list')
+            for entry in entries:
+                if isinstance(entry, str):
+                    host, _, port = entry.partition(':')
+                    entry = {'ip': host, 'port': port or TV_PORT}
+                host = (entry.get('ip') or entry.get('host') or '').strip()
+                if not host:
+                    logger.warning(f'[CONFIG] Ignoring TV target without ip: {entry}')
+                    continue
+                show = entry.get('show', TV_SHOW_AFTER_UPLOAD)
+                if isinstance(show, str):
+                    show = show.lower() in ('1', 'true', 'yes')
+                targets.append(TVTarget(
+                    host=host,
+                    port=int(entry.get('port') or TV_PORT),
+                    matte=entry.get('matte', TV_MATTE) or None,
+                    show=bool(show),
+                    timeout=int(entry.get('timeout') or TV_UPLOAD_TIMEOUT),
+                    url=(entry.get('url') or '').strip() or None,
+                ))
+        except Exception as e:
+            logger.error(f'[CONFIG] Failed to parse TV_TARGETS ({e}); falling back to TV_IP')
+            targets = []
+    if not targets and TV_IP:
+        targets.append(TVTarget(host=TV_IP))
+
+    # Drop duplicates while preserving order
+    unique = {}
+    for target in targets:
+        unique.setdefault(target.key, target)
+    return list(unique.values())
+
+
+TV_TARGETS = _parse_tv_targets()
+
+
+def _parse_clip(value: str) -> dict | None:
+    """Parse ``SCREENSHOT_CLIP`` ("x,y,width,height") into a CDP clip rect."""
+    if not value:
+        return None
+    try:
+        x, y, width, height = (float(part) for part in value.split(','))
+        if width <= 0 or height <= 0:
+            raise ValueError('width and height must be positive')
+        return {'x': x, 'y': y, 'width': width, 'height': height, 'scale': 1}
+    except Exception as e:
+        logger.error(f'[CONFIG] Ignoring invalid SCREENSHOT_CLIP {value!r} ({e}); capturing the full viewport')
+        return None
+
+
+SCREENSHOT_CLIP_RECT = _parse_clip(SCREENSHOT_CLIP)
+
+_READY_TYPES = ('selector', 'expression', 'quiet_ms', 'fonts', 'images')
+
+
+def _parse_ready_predicates() -> list[dict]:
+    """Parse ``SCREENSHOT_READY`` into ``{'type', 'value', 'timeout'}`` dicts.
+
+    Entries are either CSS selector strings or objects with exactly one of
+    ``selector``, ``expression``, ``quiet_ms``, ``fonts`` or ``images`` and an
+    optional ``timeout`` in seconds (default ``SCREENSHOT_READY_TIMEOUT``).
+    """
+    if not SCREENSHOT_READY_JSON:
+        return []
+    predicates = []
+    try:
+        entries = json.loads(SCREENSHOT_READY_JSON)
+        if not isinstance(entries, list):
+            raise ValueError('expected a JSON list')
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {'selector': entry}
+            kinds = [k for k in _READY_TYPES if k in entry]
+            if len(kinds) != 1:
+                logger.warning(f'[CONFIG] Ignoring readiness predicate without exactly one of {", ".join(_READY_TYPES)}: {entry}')
+                continue
+            kind = kinds[0]
+            if kind in ('fonts', 'images') and not entry[kind]:
+                continue
+            predicates.append({
+                'type': kind,
+                'value': entry[kind],
+                'timeout': float(entry.get('timeout') or SCREENSHOT_READY_TIMEOUT),
+            })
+    except Exception as e:
+        logger.error(f'[CONFIG] Failed to parse SCREENSHOT_READY ({e}); waiting for network idle instead')
+        return []
+    return predicates
+
+
+SCREENSHOT_READY = _parse_ready_predicates()
+
+# Image worker processes re-import this module as __mp_main__; only the add-on
+# process itself logs the startup banner.
+if __name__ != '__mp_main__':
+    logger.info('Screenshot to Samsung Frame Addon - Starting')
+if DEBUG_LOGGING and __name__ != '__mp_main__':
     logger.info('='*60)
     logger.info(f'Configuration:')
     logger.info(f'  Target URL: {TARGET_URL if TARGET_URL else "NOT SET"}')
     logger.info(f'  Auth Type: {TARGET_AUTH_TYPE}')
-    logger.info(f'  Interval: {INTERVAL}s')
+    logger.info(f'  Interval: {INTERVAL}s (adaptive {SCHEDULE_MIN_INTERVAL}-{SCHEDULE_MAX_INTERVAL}s, backoff up to {SCHEDULE_BACKOFF_MAX}s)')
     logger.info(f'  Screenshot: {SCREENSHOT_WIDTH}x{SCREENSHOT_HEIGHT} @ {SCREENSHOT_ZOOM}% zoom')
     logger.info(f'  Screenshot Wait: {SCREENSHOT_WAIT}s (after network idle)')
+    if SCREENSHOT_READY:
+        logger.info(f'  Readiness: ' + ', '.join(f'{p["type"]}={p["value"]} ({p["timeout"]}s)' for p in SCREENSHOT_READY))
     logger.info(f'  Screenshot Skip Navigation: {SCREENSHOT_SKIP_NAVIGATION}')
+    logger.info(f'  Browser Watchdog: every {BROWSER_WATCHDOG_INTERVAL}s, limits rss={BROWSER_MAX_RSS_MB or "none"} MB, '
+                f'page heap={PAGE_MAX_HEAP_MB or "none"} MB, page age={PAGE_MAX_AGE_HOURS or "none"} h')
+    if BROWSER_PERSISTENT_PROFILE:
+        logger.info(f'  Browser Profile: {BROWSER_PROFILE_DIR} (disk cache up to {BROWSER_CACHE_SIZE_MB} MB)')
+    else:
+        logger.info(f'  Browser Profile: temporary')
+    if RENDER_BLOCK_TYPES or RENDER_DENY_PATTERNS or RENDER_MAX_REQUESTS or RENDER_MAX_BYTES:
+        logger.info(f'  Request Blocking: types={",".join(sorted(RENDER_BLOCK_TYPES)) or "none"}, deny={len(RENDER_DENY_PATTERNS)} allow={len(RENDER_ALLOW_PATTERNS)} patterns, '
+                    f'budget {RENDER_MAX_REQUESTS or "unlimited"} requests / {RENDER_MAX_BYTES or "unlimited"} bytes')
+    if SCREENSHOT_SCREENCAST:
+        logger.info(f'  Screencast: ENABLED (repaints {"trigger a capture" if SCREENSHOT_SCREENCAST_TRIGGER else "are picked up on schedule"})')
+    logger.info(f'  Screenshot Capture: {SCREENSHOT_CAPTURE}, {SCREENSHOT_FORMAT}' + (f' q{SCREENSHOT_QUALITY}' if SCREENSHOT_FORMAT == 'jpeg' else '')
+                + (f', clip {SCREENSHOT_CLIP}' if SCREENSHOT_CLIP_RECT else '') + (', optimized for speed' if SCREENSHOT_OPTIMIZE_FOR_SPEED else ''))
+    logger.info(f'  Skip Unchanged Frames: {SCREENSHOT_SKIP_UNCHANGED} (threshold {SCREENSHOT_CHANGE_THRESHOLD}%)')
+    if IMAGE_PROCESSING:
+        logger.info(f'  Image Output: {IMAGE_OUTPUT_WIDTH}x{IMAGE_OUTPUT_HEIGHT} ({IMAGE_FIT}), JPEG q{IMAGE_JPEG_QUALITY} {IMAGE_JPEG_SUBSAMPLING}, sharpen {IMAGE_SHARPEN}%, {IMAGE_PROCESS_WORKERS} worker(s)')
+    else:
+        logger.info(f'  Image Output: as rendered (post-processing disabled)')
+    if IMAGE_MAX_BYTES or IMAGE_MIN_SSIM:
+        logger.info(f'  Image Budget: {IMAGE_MAX_BYTES or "no"} byte limit, min SSIM {IMAGE_MIN_SSIM or "off"}, quality {IMAGE_MIN_QUALITY}-{IMAGE_JPEG_QUALITY}')
     logger.info(f'  Art Path: {ART_PATH}')
-    logger.info(f'  TV Upload: {"ENABLED" if TV_IP else "DISABLED"}')
-    if TV_IP:
-        logger.info(f'  TV IP: {TV_IP}:{TV_PORT}')
-        logger.info(f'  TV Matte: {TV_MATTE if TV_MATTE else "none"}')
-        logger.info(f'  TV Show After Upload: {TV_SHOW_AFTER_UPLOAD}')
-        logger.info(f'  TV Upload Timeout: {TV_UPLOAD_TIMEOUT}s')
-        logger.info(f'  TV Deletion Max Retries: {TV_DELETION_RETRY_MAX}')
+    logger.info(f'  TV Upload: {"ENABLED" if TV_TARGETS else "DISABLED"}')
+    for tv_target in TV_TARGETS:
+        logger.info(f'  TV {tv_target.key}: matte={tv_target.matte or "none"}, show={tv_target.show}, timeout={tv_target.timeout}s')
+    if TV_TARGETS:
+        logger.info(f'  TV Upload Concurrency: {TV_UPLOAD_CONCURRENCY}')
+        logger.info(f'  TV Deletion Max Retries: {TV_DELETION_RETRY_MAX}, bulk chunk {TV_DELETE_CHUNK}')
+        logger.info(f'  TV Art GC: {f"every {TV_GC_INTERVAL}s, {TV_GC_BATCH} deletions per pass" if TV_GC_INTERVAL > 0 else "DISABLED"}')
+    logger.info(f'  Trigger Entities: {", ".join(TRIGGER_ENTITIES) if TRIGGER_ENTITIES else "none (fixed interval)"}')
+    if TRIGGER_ENTITIES:
+        logger.info(f'  Trigger Debounce: {TRIGGER_DEBOUNCE}s via {HA_WEBSOCKET_URL}')
     logger.info(f'  Debug Logging: {DEBUG_LOGGING}')
+    logger.info(f'  Trace History: {TRACE_HISTORY_SIZE} cycles{" (persisted)" if TRACE_PERSIST else ""}')
     logger.info(f'  MQTT: {"ENABLED" if MQTT_ENABLED else "DISABLED"}')
     if MQTT_ENABLED:
         logger.info(f'  MQTT Broker: {MQTT_BROKER}:{MQTT_PORT}')
@@ -116,291 +353,906 @@ if DEBUG_LOGGING:
     logger.info('='*60)
 
 
-def _load_deletion_retry_state():
-    """Load deletion retry state from persistent file."""
+# ---------------------------------------------------------------------------
+# Prometheus metrics (text exposition format, no client library needed)
+# ---------------------------------------------------------------------------
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _Metric:
+    """Base class for a labelled metric; values may be updated from executor threads."""
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values = {}
+        _METRICS.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key: tuple, extra: str = '') -> str:
+        parts = [f'{name}="{_escape_label(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            parts.append(extra)
+        return '{' + ','.join(parts) + '}' if parts else ''
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            return [f'{self.name}{self._labels(key)} {value}' for key, value in sorted(self._values.items())]
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback  # optional zero-argument function sampled at scrape time
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> list[str]:
+        if self._callback is not None:
+            try:
+                value = self._callback()
+                if value is not None:
+                    self.set(value)
+            except Exception as e:
+                logger.debug(f'[METRICS] Gauge {self.name} callback failed: {e}')
+        return super().samples()
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def register(self, **labels):
+        """Pre-create a label set so it is exported before the first observation."""
+        key = self._key(labels)
+        with self._lock:
+            self._values.setdefault(key, ([0] * len(self.buckets), 0.0, 0))
+
+    def samples(self) -> list[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, counts):
+                    le = f'le="{bound}"'
+                    lines.append(f'{self.name}_bucket{self._labels(key, le)} {bucket_count}')
+                le = 'le="+Inf"'
+                lines.append(f'{self.name}_bucket{self._labels(key, le)} {count}')
+                lines.append(f'{self.name}_sum{self._labels(key)} {total}')
+                lines.append(f'{self.name}_count{self._labels(key)} {count}')
+        return lines
+
+
+_METRICS = []
+
+# Stages of a capture cycle whose durations are tracked
+METRIC_STAGES = ('fetch', 'navigate', 'ready', 'screenshot', 'encode', 'tv_connect', 'upload', 'select', 'delete')
+
+METRIC_STAGE_DURATION = Histogram(
+    'screenshot_frame_stage_duration_seconds', 'Duration of each capture/upload stage', ('stage',)
+)
+for _stage in METRIC_STAGES:
+    METRIC_STAGE_DURATION.register(stage=_stage)
+METRIC_CYCLES = Counter('screenshot_frame_cycles_total', 'Capture cycles run')
+METRIC_UPLOADS_SKIPPED = Counter('screenshot_frame_uploads_skipped_total', 'TV uploads skipped because the frame was unchanged', ('tv',))
+METRIC_FAILURES = Counter('screenshot_frame_failures_total', 'Failures by stage', ('stage',))
+METRIC_BROWSER_LAUNCHES = Counter('screenshot_frame_browser_launches_total', 'Chromium (re)launches')
+METRIC_FRAMES_SUPERSEDED = Counter('screenshot_frame_frames_superseded_total', 'Rendered frames replaced by a newer one before their TV upload started')
+METRIC_DELETION_RETRIES = Counter('screenshot_frame_deletion_retries_total', 'Retried deletions of previous TV art')
+METRIC_ART_GC_DELETIONS = Counter('screenshot_frame_art_gc_deletions_total', 'Orphaned TV art deleted by the reconciliation pass', ('tv',))
+METRIC_REQUESTS_BLOCKED = Counter('screenshot_frame_requests_blocked_total', 'Render page requests blocked by interception rules', ('reason',))
+METRIC_BROWSER_RECYCLES = Counter('screenshot_frame_browser_recycles_total', 'Pages or browsers recycled by the memory watchdog', ('scope', 'reason'))
+METRIC_PAGE_JS_HEAP = Gauge('screenshot_frame_page_js_heap_bytes', 'JS heap used by each pooled page at the last watchdog sample', ('target',))
+METRIC_IMAGE_SIZE = Gauge('screenshot_frame_image_size_bytes', 'Size of the most recent frame', ('target',))
+
+
+@contextmanager
+def _timed(stage: str, **info):
+    """Record the duration of the enclosed block under ``stage``.
+
+    Works around both sync and ``await`` code since it only reads the clock.
+    Yields a span dict that the block may annotate (e.g. ``bytes``); the span
+    is added to the current cycle trace, if any.
+    """
+    start = time.monotonic()
+    span = dict(info)
+    try:
+        yield span
+    except BaseException as e:
+        span['error'] = repr(e)
+        raise
+    finally:
+        end = time.monotonic()
+        METRIC_STAGE_DURATION.observe(end - start, stage=stage)
+        trace = _trace_var.get()
+        if trace is not None:
+            span['stage'] = stage
+            span['start'] = round(start - trace['_t0'], 3)
+            span['end'] = round(end - trace['_t0'], 3)
+            trace['stages'].append(span)
+
+
+# ---------------------------------------------------------------------------
+# Per-cycle traces
+# ---------------------------------------------------------------------------
+
+_trace_var = contextvars.ContextVar('cycle_trace', default=None)
+_trace_history = deque(maxlen=TRACE_HISTORY_SIZE)
+
+
+def _new_trace(cycle: int, kind: str = 'render') -> dict:
+    """Start a trace record for a capture cycle (``render``) or the TV upload
+    of its frames (``upload``) and make it current."""
+    trace = {
+        'cycle': cycle,
+        'kind': kind,
+        'started': datetime.now().isoformat(timespec='milliseconds'),
+        'duration': None,
+        'outcome': None,
+        'stages': [],
+        'targets': {},
+        'tvs': {},
+        'requests': {},
+        'error': None,
+        '_t0': time.monotonic(),
+    }
+    _trace_var.set(trace)
+    return trace
+
+
+def _run_in_executor(func, *args):
+    """``run_in_executor`` that carries the current context (and so the
+    cycle trace) into the worker thread."""
+    loop = asyncio.get_event_loop()
+    ctx = contextvars.copy_context()
+    return loop.run_in_executor(None, functools.partial(ctx.run, func, *args))
+
+
+def _append_trace_file(record: dict):
+    """Append one compact trace line to ``TRACE_HISTORY_FILE``, trimming the
+    file back to the ring size once it holds twice as many lines."""
+    line = json.dumps(record, separators=(',', ':'))
+    with open(TRACE_HISTORY_FILE, 'a') as f:
+        f.write(line + '\n')
+    with open(TRACE_HISTORY_FILE, 'r') as f:
+        lines = f.readlines()
+    if len(lines) > 2 * TRACE_HISTORY_SIZE:
+        _write_atomic(Path(TRACE_HISTORY_FILE), ''.join(lines[-TRACE_HISTORY_SIZE:]).encode())
+
+
+async def _finish_trace(trace: dict):
+    """Close a cycle trace and push it into the history ring buffer."""
+    trace['duration'] = round(time.monotonic() - trace.pop('_t0'), 3)
+    _trace_var.set(None)
+    _trace_history.append(trace)
+    if TRACE_PERSIST:
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, _append_trace_file, trace)
+        except Exception as e:
+            logger.debug(f'[TRACE] Could not persist cycle trace: {e}')
+
+
+async def _load_trace_history():
+    """Restore persisted cycle traces into the ring buffer at startup."""
+    if not TRACE_PERSIST or not os.path.exists(TRACE_HISTORY_FILE):
+        return
+
+    def _read():
+        records = []
+        with open(TRACE_HISTORY_FILE, 'r') as f:
+            for line in f.readlines()[-TRACE_HISTORY_SIZE:]:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    pass  # torn last line after a power loss
+        return records
+
     try:
-        if os.path.exists(TV_DELETION_RETRY_FILE):
-            with open(TV_DELETION_RETRY_FILE, 'r') as f:
-                return json.load(f)
+        records = await asyncio.get_event_loop().run_in_executor(None, _read)
+        _trace_history.extend(records)
+        logger.debug(f'[TRACE] Restored {len(records)} cycle traces')
     except Exception as e:
-        logger.debug(f'[TV RETRY] Could not load deletion retry state: {e}')
-    return {}
+        logger.debug(f'[TRACE] Could not load cycle history: {e}')
 
 
-def _save_deletion_retry_state(state: dict):
-    """Save deletion retry state to persistent file."""
+def _process_tree_rss(root_pid: int) -> int | None:
+    """Sum the resident set size (bytes) of a process and all its
+    descendants using ``/proc`` (Linux only)."""
     try:
-        with open(TV_DELETION_RETRY_FILE, 'w') as f:
-            json.dump(state, f)
-        logger.debug(f'[TV RETRY] Saved deletion retry state: {state}')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        parents = {}
+        rss = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'r') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # Fields after the parenthesised command name: state, ppid, ..., rss (index 21)
+            fields = stat[stat.rindex(')') + 2:].split()
+            pid = int(entry)
+            parents[pid] = int(fields[1])
+            rss[pid] = int(fields[21]) * page_size
     except Exception as e:
-        logger.warning(f'[TV RETRY] Could not save deletion retry state: {e}')
+        logger.debug(f'[METRICS] Could not read process table: {e}')
+        return None
+
+    if root_pid not in rss:
+        return None
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        total += rss.get(pid, 0)
+        pending.extend(child for child, parent in parents.items() if parent == pid)
+    return total
+
+
+def _chromium_rss() -> int | None:
+    """Resident memory of the Chromium process tree, if a browser is running."""
+    process = getattr(_browser, 'process', None) if _browser is not None else None
+    if process is None:
+        return None
+    return _process_tree_rss(process.pid)
+
+
+METRIC_CHROMIUM_RSS = Gauge('screenshot_frame_chromium_rss_bytes', 'Resident memory of the Chromium process tree', callback=_chromium_rss)
+
+
+def render_metrics() -> str:
+    """Render all registered metrics in Prometheus text format."""
+    return '\n'.join(metric.render() for metric in _METRICS) + '\n'
+
+
+class StateStore:
+    """Small namespaced key/value state kept in memory and persisted through
+    an append-only JSON-lines journal.
+
+    Every change appends one line instead of rewriting a file.  Loading
+    replays the journal and ignores a torn final line left by a power cut.
+    Once ``compact_after`` changes have accumulated, the journal is replaced
+    by a single snapshot line via an atomic rename.  Thread-safe, since TV
+    operations run in executor threads.
+    """
+
+    def __init__(self, path: str, compact_after: int = 500, migrate=None):
+        self.path = path
+        self.compact_after = compact_after
+        self._migrate = migrate  # called once to import legacy state when no journal exists yet; returns the files it read
+        self._legacy_paths = []  # imported legacy files, removed once a snapshot holds their data
+        self._data = {}
+        self._lock = threading.RLock()
+        self._file = None
+        self._entries = 0
+        self._loaded = False
+        self._migrating = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            if self._migrate is not None:
+                self._migrating = True
+                try:
+                    self._legacy_paths = list(self._migrate(self) or [])
+                except Exception as e:
+                    logger.warning(f'[STATE] Could not import legacy state: {e}')
+                finally:
+                    self._migrating = False
+            if not self._compact():
+                self._entries = self.compact_after  # retry the snapshot instead of appending to a journal without it
+            return
+        except Exception as e:
+            logger.warning(f'[STATE] Could not read {self.path}: {e}; starting empty')
+            lines = []
+        for line in lines:
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                logger.debug('[STATE] Skipping unreadable journal line')
+        self._entries = len(lines)
+        if lines and not lines[-1].endswith('\n'):
+            self._compact()  # don't append after a torn line
+
+    def _apply(self, record: dict):
+        op = record['op']
+        if op == 'snapshot':
+            self._data = record.get('data') or {}
+        elif op == 'set':
+            self._data.setdefault(record['ns'], {})[record['key']] = record['value']
+        elif op == 'del':
+            namespace = self._data.get(record['ns'])
+            if namespace is not None:
+                namespace.pop(record['key'], None)
+                if not namespace:
+                    del self._data[record['ns']]
+
+    def _write(self, record: dict, durable: bool):
+        self._apply(record)
+        if self._migrating:
+            return  # captured by the first snapshot
+        try:
+            if self._entries >= self.compact_after:
+                self._compact()
+                return
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+            self._file.flush()
+            if durable:
+                os.fsync(self._file.fileno())
+            self._entries += 1
+        except Exception as e:
+            logger.warning(f'[STATE] Could not append to {self.path}: {e}')
+
+    def _compact(self) -> bool:
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            snapshot = json.dumps({'op': 'snapshot', 'data': self._data}, separators=(',', ':')) + '\n'
+            _write_atomic(Path(self.path), snapshot.encode())
+            self._entries = 1
+            logger.debug(f'[STATE] Compacted {self.path}')
+        except Exception as e:
+            logger.warning(f'[STATE] Could not compact {self.path}: {e}')
+            return False
+        while self._legacy_paths:
+            path = self._legacy_paths.pop()
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.debug(f'[STATE] Could not remove imported {path}: {e}')
+        return True
+
+    def get(self, namespace: str, key: str, default=None):
+        with self._lock:
+            self._ensure_loaded()
+            return self._data.get(namespace, {}).get(key, default)
+
+    def items(self, namespace: str) -> dict:
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._data.get(namespace, {}))
+
+    def set(self, namespace: str, key: str, value, durable: bool = False):
+        """Set a value; ``durable`` fsyncs the journal before returning."""
+        with self._lock:
+            self._ensure_loaded()
+            self._write({'op': 'set', 'ns': namespace, 'key': key, 'value': value}, durable)
+
+    def delete(self, namespace: str, key: str, durable: bool = False):
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._data.get(namespace, {}):
+                self._write({'op': 'del', 'ns': namespace, 'key': key}, durable)
 
+    def close(self):
+        """Compact and close the journal (at shutdown)."""
+        with self._lock:
+            if self._loaded:
+                self._compact()
 
-def _increment_deletion_retry(image_id: str):
+
+def _migrate_legacy_state(store: StateStore) -> list[str]:
+    """Import the deletion-retry JSON file and the last-art-ID text files that
+    preceded the state journal.  Returns their paths; the store removes them
+    once its first snapshot is written."""
+    imported = []
+    if os.path.exists(TV_DELETION_RETRY_FILE):
+        with open(TV_DELETION_RETRY_FILE, 'r') as f:
+            state = json.load(f)
+        # The older flat {image_id: count} layout belongs to the single TV_IP TV
+        legacy = {k: v for k, v in state.items() if not isinstance(v, dict)}
+        state = {k: v for k, v in state.items() if isinstance(v, dict)}
+        if legacy and TV_IP:
+            state.setdefault(f'{TV_IP}:{TV_PORT}', {}).update(legacy)
+        for tv_key, counters in state.items():
+            store.set('deletion_retries', tv_key, counters)
+        imported.append(TV_DELETION_RETRY_FILE)
+        logger.info(f'[STATE] Imported deletion retry counters from {TV_DELETION_RETRY_FILE}')
+
+    legacy_files = []
+    if TV_IP and os.path.exists(TV_LAST_ART_FILE):
+        legacy_files.append((f'{TV_IP}:{TV_PORT}', TV_LAST_ART_FILE))
+    for path in sorted(Path(TV_LAST_ART_FILE).parent.glob('last-art-id-*.txt')):
+        # last-art-id-<host>-<port>.txt; per-TV files win over the legacy single-TV file
+        host, _, port = path.stem[len('last-art-id-'):].rpartition('-')
+        if host and port.isdigit():
+            legacy_files.append((f'{host}:{port}', str(path)))
+    for tv_key, path in legacy_files:
+        with open(path, 'r') as f:
+            content_id = f.read().strip()
+        if content_id:
+            store.set('last_art', tv_key, content_id)
+        imported.append(path)
+    if legacy_files:
+        logger.info(f'[STATE] Imported {len(legacy_files)} cached art ID file(s)')
+    return imported
+
+
+_state = StateStore(TV_STATE_FILE, migrate=_migrate_legacy_state)
+
+# Upload history entries kept per TV
+_UPLOAD_HISTORY_SIZE = 50
+
+
+def _get_deletion_retries(tv_key: str, image_id: str) -> int:
+    """Return the number of deletion attempts recorded for an image ID.
+
+    Counters are keyed by TV (``host:port``) and then by image ID, since
+    content IDs such as ``MY_F0001`` repeat across TVs.
+    """
+    return (_state.get('deletion_retries', tv_key) or {}).get(image_id, 0)
+
+
+def _increment_deletion_retry(tv_key: str, image_id: str):
     """Increment retry counter for an image ID."""
-    state = _load_deletion_retry_state()
-    current_retries = state.get(image_id, 0)
-    state[image_id] = current_retries + 1
-    _save_deletion_retry_state(state)
-    return state[image_id]
+    with _state._lock:
+        counters = dict(_state.get('deletion_retries', tv_key) or {})
+        counters[image_id] = counters.get(image_id, 0) + 1
+        _state.set('deletion_retries', tv_key, counters)
+        return counters[image_id]
 
 
-def _should_retry_deletion(image_id: str) -> bool:
+def _should_retry_deletion(tv_key: str, image_id: str) -> bool:
     """Check if we should retry deleting an image ID."""
-    state = _load_deletion_retry_state()
-    retries = state.get(image_id, 0)
-    return retries < TV_DELETION_RETRY_MAX
+    return _get_deletion_retries(tv_key, image_id) < TV_DELETION_RETRY_MAX
+
+
+def _clear_deletion_retry(tv_key: str, image_id: str | None = None):
+    """Clear retry counter for an image ID (after successful deletion), or
+    every counter for the TV when no image ID is given."""
+    with _state._lock:
+        counters = _state.get('deletion_retries', tv_key)
+        if counters is None:
+            return
+        if image_id is None:
+            _state.delete('deletion_retries', tv_key)
+        elif image_id in counters:
+            counters = {k: v for k, v in counters.items() if k != image_id}
+            if counters:
+                _state.set('deletion_retries', tv_key, counters)
+            else:
+                _state.delete('deletion_retries', tv_key)
+
+
+def _read_last_art_id(host: str, port: int) -> str | None:
+    """Return the cached ID of the art last uploaded to a TV."""
+    return _state.get('last_art', f'{host}:{port}')
+
+
+def _write_last_art_id(host: str, port: int, content_id: str):
+    """Cache the last uploaded art ID for a TV (fsynced; it drives cleanup)."""
+    _state.set('last_art', f'{host}:{port}', str(content_id), durable=True)
+
+
+def _clear_last_art_id(host: str, port: int):
+    """Remove the cached art ID for a TV.
+
+    Called once that art is gone from the TV, so the skip-unchanged state is
+    dropped too and the next frame is uploaded even if it is identical.
+    """
+    _state.delete('last_art', f'{host}:{port}', durable=True)
+    _last_uploaded.pop(f'{host}:{port}', None)
+
+
+def _record_upload(tv_key: str, content_id: str, sha256: str):
+    """Append an upload to the TV's bounded upload history."""
+    with _state._lock:
+        history = list(_state.get('uploads', tv_key) or [])
+        history.append({'id': content_id, 'time': datetime.now().isoformat(timespec='seconds'), 'sha256': sha256[:16]})
+        _state.set('uploads', tv_key, history[-_UPLOAD_HISTORY_SIZE:], durable=True)
+
+
+def _remember_owned_art(tv_key: str, content_id: str):
+    """Add a freshly uploaded content ID to the TV's owned-art index.
+
+    Called as soon as ``tv.upload()`` returns and fsynced, so a crash during
+    the select/delete steps that follow cannot orphan the image.
+    """
+    with _state._lock:
+        owned = _owned_art(tv_key)
+        if content_id not in owned:
+            owned[content_id] = datetime.now().isoformat(timespec='seconds')
+            _state.set('owned_art', tv_key, owned, durable=True)
+
+
+def _owned_art(tv_key: str) -> dict:
+    """Content IDs this add-on uploaded to a TV and has not yet seen deleted
+    (content ID -> upload time)."""
+    return dict(_state.get('owned_art', tv_key) or {})
+
+
+def _forget_owned_art(tv_key: str, *content_ids: str):
+    """Drop content IDs from a TV's owned-art index (no IDs: drop them all)."""
+    with _state._lock:
+        owned = _owned_art(tv_key)
+        if not content_ids:
+            if owned:
+                _state.delete('owned_art', tv_key)
+            return
+        remaining = {cid: t for cid, t in owned.items() if cid not in content_ids}
+        if len(remaining) == len(owned):
+            return
+        if remaining:
+            _state.set('owned_art', tv_key, remaining)
+        else:
+            _state.delete('owned_art', tv_key)
+
+
+# Persistent Samsung TV art-mode connections, keyed by (host, port)
+_tv_connections = {}
+_tv_connection_locks = {}
+_tv_connections_guard = threading.Lock()
+
+
+def _tv_lock(host: str, port: int) -> threading.Lock:
+    """Return the lock serializing access to one TV's connection."""
+    with _tv_connections_guard:
+        return _tv_connection_locks.setdefault((host, port), threading.Lock())
+
+
+# Whole TV operations (an upload, a GC pass, a background job), keyed by TV key
+_tv_op_locks = {}
+
+
+def _tv_op_lock(tv_key: str) -> asyncio.Lock:
+    """Return the lock that keeps multi-step operations on one TV from
+    interleaving; ``_tv_lock`` only covers a single connection session."""
+    return _tv_op_locks.setdefault(tv_key, asyncio.Lock())
+
+
+def _close_tv_connection(host: str, port: int):
+    """Close and forget the cached connection for a TV (call with its lock held)."""
+    entry = _tv_connections.pop((host, port), None)
+    if entry:
+        try:
+            entry['tv'].close()
+            logger.debug(f'[TV CONN] Closed connection to {host}:{port}')
+        except Exception as e:
+            logger.debug(f'[TV CONN] Error closing connection to {host}:{port}: {e}')
+
+
+def _tv_token_file(host: str, port: int) -> str:
+    """Path of a TV's pairing token (``tv-token-<host>-<port>.txt``).
+
+    Tokens are issued per TV, so each TV gets its own file; the legacy shared
+    token file is adopted by the TV it was paired with (``TV_IP``, or the
+    only configured TV).
+    """
+    path = str(Path(TV_TOKEN_FILE).with_name(f'tv-token-{host}-{port}.txt'))
+    legacy_owner = f'{TV_IP}:{TV_PORT}' if TV_IP else (TV_TARGETS[0].key if len(TV_TARGETS) == 1 else None)
+    if legacy_owner == f'{host}:{port}' and not os.path.exists(path) and os.path.exists(TV_TOKEN_FILE):
+        try:
+            os.replace(TV_TOKEN_FILE, path)
+            logger.info(f'[TV CONN] Moved {TV_TOKEN_FILE} to {path}')
+        except OSError as e:
+            logger.warning(f'[TV CONN] Could not move {TV_TOKEN_FILE} to {path}: {e}')
+    return path
+
+
+def _get_tv_connection(host: str, port: int):
+    """Return an open SamsungTVArt connection for a TV, or None if the TV
+    does not support art mode.
+
+    Runs in an executor thread with the TV's lock held.  A cached connection
+    is reused if it was used recently; connections idle for longer than
+    ``TV_PING_INTERVAL`` are pinged first and reopened if the ping fails.
+    The ``supported()`` capability check only runs when a connection is opened.
+    """
+    from samsungtvws import SamsungTVArt
+
+    key = (host, port)
+    entry = _tv_connections.get(key)
+    now = time.monotonic()
+    if entry and now - entry['last_used'] > TV_PING_INTERVAL:
+        try:
+            entry['tv'].get_api_version()
+            logger.debug(f'[TV CONN] Connection to {host}:{port} is alive')
+        except Exception as e:
+            logger.debug(f'[TV CONN] Ping to {host}:{port} failed ({e}); reconnecting')
+            _close_tv_connection(host, port)
+            entry = None
+
+    if entry is None:
+        token_file = _tv_token_file(host, port)
+        logger.debug(f'[TV CONN] Connecting to {host}:{port} (token file: {token_file})')
+        tv = SamsungTVArt(host=host, port=port, token_file=token_file)
+        tv.open()
+        if not tv.supported():
+            try:
+                tv.close()
+            except Exception:
+                pass
+            return None
+        entry = {'tv': tv, 'last_used': now}
+        _tv_connections[key] = entry
+        logger.debug(f'[TV CONN] ✓ Connected to {host}:{port}')
+
+    entry['last_used'] = now
+    return entry['tv']
 
 
-def _clear_deletion_retry(image_id: str):
-    """Clear retry counter for an image ID (after successful deletion)."""
-    state = _load_deletion_retry_state()
-    if image_id in state:
-        del state[image_id]
-        _save_deletion_retry_state(state)
+@contextmanager
+def _tv_session(host: str, port: int):
+    """Context manager yielding the persistent connection for a TV.
 
+    Operations on the same TV are serialized.  If the body raises, the
+    connection is dropped so the next operation reconnects.
+    """
+    with _tv_lock(host, port):
+        with _timed('tv_connect', tv=f'{host}:{port}'):
+            tv = _get_tv_connection(host, port)
+        try:
+            yield tv
+        except Exception:
+            _close_tv_connection(host, port)
+            raise
+        finally:
+            if tv is not None and (host, port) in _tv_connections:
+                _tv_connections[(host, port)]['last_used'] = time.monotonic()
+
+
+async def _reset_tv_connections(targets: list | None = None):
+    """Close the cached connections of ``targets`` (default: all TVs), e.g.
+    after repeated failures."""
+    def _close_all():
+        keys = list(_tv_connections) if targets is None else [(t.host, t.port) for t in targets]
+        for host, port in keys:
+            with _tv_lock(host, port):
+                _close_tv_connection(host, port)
+
+    loop = asyncio.get_event_loop()
+    try:
+        await asyncio.wait_for(loop.run_in_executor(None, _close_all), timeout=TV_UPLOAD_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning('[TV CONN] Timed out closing TV connections')
 
-async def upload_image_to_tv_async(host: str, port: int, image_path: str, matte: str = None, show: bool = True):
+
+async def upload_image_to_tv_async(
+    host: str,
+    port: int,
+    data: bytes,
+    matte: str = None,
+    show: bool = True,
+    file_type: str = 'jpg',
+    timeout: int = TV_UPLOAD_TIMEOUT,
+):
     """Upload image to Samsung TV using sync library in executor."""
     logger.debug(f'[TV UPLOAD] Starting upload to {host}:{port}')
-    
-    try:
-        from samsungtvws import SamsungTVArt
-    except Exception as e:
-        logger.error(f'[TV UPLOAD] ERROR: samsungtvws library not available: {e}')
-        return None
+    tv_key = f'{host}:{port}'
 
     def _sync_upload():
         """Synchronous upload function to run in executor."""
-        token_file = '/data/tv-token.txt'
-        tv = None
         # Create local copy of show parameter so we can modify it
         local_show = show
         try:
-            logger.debug(f'[TV UPLOAD] Connecting to TV (token file: {token_file})')
-            tv = SamsungTVArt(host=host, port=port, token_file=token_file)
-            tv.open()
-
-            supported = tv.supported()
-            if not supported:
-                logger.error('[TV UPLOAD] ERROR: TV does not support art mode via this API')
-                tv.close()
-                return None
-
-            # read image bytes
-            logger.debug(f'[TV UPLOAD] Reading image from {image_path}')
-            with open(image_path, 'rb') as f:
-                data = f.read()
-            logger.debug(f'[TV UPLOAD] Image size: {len(data)} bytes')
+            with _tv_session(host, port) as tv:
+                if tv is None:
+                    logger.error('[TV UPLOAD] ERROR: TV does not support art mode via this API')
+                    return None
 
-            file_type = os.path.splitext(image_path)[1][1:].upper() or 'JPEG'
-            logger.debug(f'[TV UPLOAD] Uploading image (type={file_type}, matte={matte}, show={local_show})')
+                logger.debug(f'[TV UPLOAD] Image size: {len(data)} bytes')
+                logger.debug(f'[TV UPLOAD] Uploading image (type={file_type}, matte={matte}, show={local_show})')
             
-            # Get cached ID for cleanup after upload
-            last_id = None
-            if os.path.exists(TV_LAST_ART_FILE):
-                try:
-                    with open(TV_LAST_ART_FILE, 'r') as lf:
-                        last_id = lf.read().strip() or None
-                    if last_id:
-                        logger.debug(f'[TV UPLOAD] Found cached art ID: {last_id}')
-                except Exception:
-                    pass
+                # Get cached ID for cleanup after upload
+                last_id = _read_last_art_id(host, port)
+                if last_id:
+                    logger.debug(f'[TV UPLOAD] Found cached art ID: {last_id}')
 
-            # Upload new art
-            logger.debug('[TV UPLOAD] Uploading new art entry')
-            content_id = None
-            try:
-                if matte:
-                    content_id = tv.upload(data, file_type=file_type.lower(), matte=matte)
-                else:
-                    content_id = tv.upload(data, file_type=file_type.lower())
-            except TypeError:
-                content_id = tv.upload(data, file_type=file_type.lower())
-
-            logger.debug(f'[TV UPLOAD] Upload returned id: {content_id}')
-            if content_id is not None:
-                # Check if TV is in art mode - if so, force show=True so image actually displays
-                tv_in_art_mode = False
-                try:
-                    art_mode_status = tv.get_artmode()
-                    logger.debug(f'[TV UPLOAD] TV art mode status: {art_mode_status} (type: {type(art_mode_status).__name__})')
-                    # Check various possible return values: 'on', 'On', True, etc.
-                    if art_mode_status and str(art_mode_status).lower() in ('on', 'true', '1'):
-                        tv_in_art_mode = True
-                        local_show = True
-                        logger.debug('[TV UPLOAD] TV is in art mode, forcing show=True')
-                except Exception as e:
-                    logger.debug(f'[TV UPLOAD] Could not check art mode status: {e}')
-                
-                # Try to select image (may fail if TV is busy/not in art mode, but we still delete old images)
-                selection_successful = False
-                selection_error = None
-                logger.debug(f'[TV UPLOAD] Attempting to select image on TV (show={local_show}, art_mode={tv_in_art_mode})')
+                # Upload new art
+                logger.debug('[TV UPLOAD] Uploading new art entry')
+                content_id = None
                 try:
-                    # Try to select with show parameter (controls whether image is displayed)
-                    tv.select_image(content_id, show=local_show)
-                    logger.debug(f'[TV UPLOAD] ✓ Selected uploaded image on TV (show={local_show})')
-                    selection_successful = True
+                    with _timed('upload', tv=tv_key, bytes=len(data)):
+                        if matte:
+                            content_id = tv.upload(data, file_type=file_type.lower(), matte=matte)
+                        else:
+                            content_id = tv.upload(data, file_type=file_type.lower())
                 except TypeError:
-                    # If show parameter not supported, try without it
+                    with _timed('upload', tv=tv_key, bytes=len(data)):
+                        content_id = tv.upload(data, file_type=file_type.lower())
+
+                logger.debug(f'[TV UPLOAD] Upload returned id: {content_id}')
+                if content_id is not None:
+                    try:
+                        _remember_owned_art(tv_key, str(content_id))
+                    except Exception as e:
+                        logger.warning(f'[TV UPLOAD] Warning: Failed to index art ID {content_id}: {e}')
+                    # Check if TV is in art mode - if so, force show=True so image actually displays
+                    tv_in_art_mode = False
+                    try:
+                        art_mode_status = tv.get_artmode()
+                        logger.debug(f'[TV UPLOAD] TV art mode status: {art_mode_status} (type: {type(art_mode_status).__name__})')
+                        # Check various possible return values: 'on', 'On', True, etc.
+                        if art_mode_status and str(art_mode_status).lower() in ('on', 'true', '1'):
+                            tv_in_art_mode = True
+                            local_show = True
+                            logger.debug('[TV UPLOAD] TV is in art mode, forcing show=True')
+                    except Exception as e:
+                        logger.debug(f'[TV UPLOAD] Could not check art mode status: {e}')
+                
+                    # Try to select image (may fail if TV is busy/not in art mode, but we still delete old images)
+                    selection_successful = False
+                    selection_error = None
+                    logger.debug(f'[TV UPLOAD] Attempting to select image on TV (show={local_show}, art_mode={tv_in_art_mode})')
                     try:
-                        tv.select_image(content_id)
-                        logger.debug('[TV UPLOAD] ✓ Selected uploaded image on TV (without show parameter)')
+                        # Try to select with show parameter (controls whether image is displayed)
+                        with _timed('select', tv=tv_key):
+                            tv.select_image(content_id, show=local_show)
+                        logger.debug(f'[TV UPLOAD] ✓ Selected uploaded image on TV (show={local_show})')
                         selection_successful = True
+                    except TypeError:
+                        # If show parameter not supported, try without it
+                        try:
+                            with _timed('select', tv=tv_key):
+                                tv.select_image(content_id)
+                            logger.debug('[TV UPLOAD] ✓ Selected uploaded image on TV (without show parameter)')
+                            selection_successful = True
+                        except Exception as e:
+                            selection_error = str(e)
+                            logger.warning(f'[TV UPLOAD] WARNING: Failed to select uploaded image: {e}')
+                            logger.warning('[TV UPLOAD] Image will be available in TV gallery, but not currently displayed')
                     except Exception as e:
                         selection_error = str(e)
                         logger.warning(f'[TV UPLOAD] WARNING: Failed to select uploaded image: {e}')
                         logger.warning('[TV UPLOAD] Image will be available in TV gallery, but not currently displayed')
+
+                    # IMPORTANT: Delete old art regardless of selection success
+                    # This ensures cleanup even if TV was busy/not in art mode during selection
+                    deletion_successful = False
+                    if last_id and last_id != content_id:
+                        if _should_retry_deletion(tv_key, last_id):
+                            try:
+                                retry_count = _increment_deletion_retry(tv_key, last_id)
+                                if retry_count > 1:
+                                    METRIC_DELETION_RETRIES.inc()
+                                logger.info(f'[TV UPLOAD] Attempting to delete previous art entry: {last_id} (attempt {retry_count}/{TV_DELETION_RETRY_MAX})')
+                                with _timed('delete', tv=tv_key, attempt=retry_count):
+                                    if not tv.delete(last_id):
+                                        raise RuntimeError('TV rejected the delete')
+                                logger.info('[TV UPLOAD] ✓ Previous art successfully deleted')
+                                _clear_deletion_retry(tv_key, last_id)  # Clear retry counter on success
+                                _forget_owned_art(tv_key, last_id)
+                                deletion_successful = True
+                            except Exception as e:
+                                logger.error(f'[TV UPLOAD] ERROR: Failed to delete previous art (ID: {last_id}): {e}')
+                                logger.warning(f'[TV UPLOAD] Will retry deletion on next sync cycle (attempts remaining: {TV_DELETION_RETRY_MAX - _get_deletion_retries(tv_key, last_id)})')
+                        else:
+                            logger.error(f'[TV UPLOAD] ERROR: Max deletion retry attempts ({TV_DELETION_RETRY_MAX}) exceeded for image ID: {last_id}')
+                            logger.warning('[TV UPLOAD] It stays in the owned-art index; the art GC pass will delete it later')
+                            try:
+                                _clear_deletion_retry(tv_key, last_id)  # Clear to avoid repeated warnings
+                            except Exception:
+                                pass
+                    elif last_id and last_id == content_id:
+                        logger.debug(f'[TV UPLOAD] New image ID matches cached ID ({content_id}), no deletion needed')
+                        _clear_deletion_retry(tv_key, last_id)  # Clear retry counter since no deletion needed
+                        deletion_successful = True
+                    elif not last_id:
+                        logger.debug('[TV UPLOAD] No previous cached image ID; nothing to delete')
+                        deletion_successful = True
+
+                # Persist last art id for future cleanup attempts
+                try:
+                    # Always save the new ID if we got one, regardless of selection/deletion status
+                    # This ensures we have it for cleanup purposes
+                    if content_id:
+                        _write_last_art_id(host, port, content_id)
+                        _record_upload(tv_key, content_id, hashlib.sha256(data).hexdigest())
+                        logger.debug(f'[TV UPLOAD] ✓ Cached art ID {content_id} in {TV_STATE_FILE}')
+                        if not selection_successful:
+                            logger.warning(f'[TV UPLOAD] Note: Image selection failed (TV may be busy/not in art mode), but image is cached for future display')
+                            if selection_error:
+                                logger.debug(f'[TV UPLOAD] Selection error: {selection_error}')
                 except Exception as e:
-                    selection_error = str(e)
-                    logger.warning(f'[TV UPLOAD] WARNING: Failed to select uploaded image: {e}')
-                    logger.warning('[TV UPLOAD] Image will be available in TV gallery, but not currently displayed')
-
-                # IMPORTANT: Delete old art regardless of selection success
-                # This ensures cleanup even if TV was busy/not in art mode during selection
-                deletion_successful = False
-                if last_id and last_id != content_id:
-                    if _should_retry_deletion(last_id):
-                        try:
-                            retry_count = _increment_deletion_retry(last_id)
-                            logger.info(f'[TV UPLOAD] Attempting to delete previous art entry: {last_id} (attempt {retry_count}/{TV_DELETION_RETRY_MAX})')
-                            tv.delete(last_id)
-                            logger.info('[TV UPLOAD] ✓ Previous art successfully deleted')
-                            _clear_deletion_retry(last_id)  # Clear retry counter on success
-                            deletion_successful = True
-                        except Exception as e:
-                            logger.error(f'[TV UPLOAD] ERROR: Failed to delete previous art (ID: {last_id}): {e}')
-                            logger.warning(f'[TV UPLOAD] Will retry deletion on next sync cycle (attempts remaining: {TV_DELETION_RETRY_MAX - _load_deletion_retry_state().get(last_id, 0)})')
-                    else:
-                        logger.error(f'[TV UPLOAD] ERROR: Max deletion retry attempts ({TV_DELETION_RETRY_MAX}) exceeded for image ID: {last_id}')
-                        logger.warning('[TV UPLOAD] This image may accumulate on TV storage. Manual cleanup may be needed.')
-                        try:
-                            _clear_deletion_retry(last_id)  # Clear to avoid repeated warnings
-                        except Exception:
-                            pass
-                elif last_id and last_id == content_id:
-                    logger.debug(f'[TV UPLOAD] New image ID matches cached ID ({content_id}), no deletion needed')
-                    _clear_deletion_retry(last_id)  # Clear retry counter since no deletion needed
-                    deletion_successful = True
-                elif not last_id:
-                    logger.debug('[TV UPLOAD] No previous cached image ID; nothing to delete')
-                    deletion_successful = True
-
-            tv.close()
-            logger.debug('[TV UPLOAD] TV connection closed')
-
-            # Persist last art id for future cleanup attempts
-            try:
-                # Always save the new ID if we got one, regardless of selection/deletion status
-                # This ensures we have it for cleanup purposes
-                if content_id:
-                    with open(TV_LAST_ART_FILE, 'w') as lf:
-                        lf.write(str(content_id))
-                    logger.debug(f'[TV UPLOAD] ✓ Cached art ID {content_id} to {TV_LAST_ART_FILE}')
-                    if not selection_successful:
-                        logger.warning(f'[TV UPLOAD] Note: Image selection failed (TV may be busy/not in art mode), but image is cached for future display')
-                        if selection_error:
-                            logger.debug(f'[TV UPLOAD] Selection error: {selection_error}')
-            except Exception as e:
-                logger.warning(f'[TV UPLOAD] Warning: Failed to cache art ID: {e}')
+                    logger.warning(f'[TV UPLOAD] Warning: Failed to cache art ID: {e}')
+
+                return content_id
 
-            return content_id
-            
         except Exception as e:
             logger.error(f'[TV UPLOAD] ERROR: Exception during TV interaction: {e}')
-            try:
-                if tv:
-                    tv.close()
-            except Exception:
-                pass
             return None
 
     # Run sync function in thread executor with timeout
-    loop = asyncio.get_event_loop()
     try:
         return await asyncio.wait_for(
-            loop.run_in_executor(None, _sync_upload),
-            timeout=TV_UPLOAD_TIMEOUT
+            _run_in_executor(_sync_upload),
+            timeout=timeout
         )
     except asyncio.TimeoutError:
-        logger.info(f'[TV UPLOAD] ERROR: Upload timed out after {TV_UPLOAD_TIMEOUT}s')
+        logger.info(f'[TV UPLOAD] ERROR: Upload to {tv_key} timed out after {timeout}s')
         return None
 
 
 async def cleanup_stale_images_async(host: str, port: int):
     """Attempt to cleanup any orphaned/stale image IDs from previous failed uploads."""
     logger.info('[TV CLEANUP] Attempting to cleanup stale images from TV')
-    
-    try:
-        from samsungtvws import SamsungTVArt
-    except Exception as e:
-        logger.error(f'[TV CLEANUP] ERROR: samsungtvws library not available: {e}')
-        return False
 
     def _sync_cleanup():
         """Synchronous cleanup function to run in executor."""
-        token_file = '/data/tv-token.txt'
-        tv = None
         try:
-            logger.debug(f'[TV CLEANUP] Connecting to TV for cleanup')
-            tv = SamsungTVArt(host=host, port=port, token_file=token_file)
-            tv.open()
-
-            # Check if TV supports art mode
-            supported = tv.supported()
-            if not supported:
-                logger.debug('[TV CLEANUP] TV does not support art mode; skipping cleanup')
-                tv.close()
-                return False
+            with _tv_session(host, port) as tv:
+                # Check if TV supports art mode
+                if tv is None:
+                    logger.debug('[TV CLEANUP] TV does not support art mode; skipping cleanup')
+                    return False
+
+                # Try to delete cached stale image ID if it exists
+                stale_id = _read_last_art_id(host, port)
+                if not stale_id:
+                    logger.debug('[TV CLEANUP] No stale image cached')
+                    return False
 
-            # Try to delete cached stale image ID if it exists
-            if os.path.exists(TV_LAST_ART_FILE):
+                logger.info(f'[TV CLEANUP] Attempting to delete stale image: {stale_id}')
                 try:
-                    with open(TV_LAST_ART_FILE, 'r') as lf:
-                        stale_id = lf.read().strip() or None
-                    
-                    if stale_id:
-                        logger.info(f'[TV CLEANUP] Attempting to delete stale image: {stale_id}')
-                        try:
-                            tv.delete(stale_id)
-                            logger.info(f'[TV CLEANUP] ✓ Successfully deleted stale image: {stale_id}')
-                            # Clear the cache file since we successfully cleaned up
-                            try:
-                                os.remove(TV_LAST_ART_FILE)
-                                logger.debug('[TV CLEANUP] Cleared stale image cache file')
-                            except Exception:
-                                pass
-                            tv.close()
-                            return True
-                        except Exception as e:
-                            logger.warning(f'[TV CLEANUP] Could not delete stale image ({stale_id}): {e}')
-                            tv.close()
-                            return False
+                    if not tv.delete(stale_id):
+                        raise RuntimeError('TV rejected the delete')
                 except Exception as e:
-                    logger.debug(f'[TV CLEANUP] Error reading stale image ID: {e}')
-                    tv.close()
+                    logger.warning(f'[TV CLEANUP] Could not delete stale image ({stale_id}): {e}')
                     return False
-            else:
-                logger.debug('[TV CLEANUP] No stale image cache file found')
-                tv.close()
-                return False
-            
+                logger.info(f'[TV CLEANUP] ✓ Successfully deleted stale image: {stale_id}')
+                # Clear the cache file since we successfully cleaned up
+                try:
+                    _clear_last_art_id(host, port)
+                    _forget_owned_art(f'{host}:{port}', stale_id)
+                    logger.debug('[TV CLEANUP] Cleared stale image cache file')
+                except Exception:
+                    pass
+                return True
+
         except Exception as e:
             logger.error(f'[TV CLEANUP] ERROR: Exception during cleanup: {e}')
-            try:
-                if tv:
-                    tv.close()
-            except Exception:
-                pass
             return False
 
     # Run sync cleanup in thread executor with timeout
-    loop = asyncio.get_event_loop()
     try:
         return await asyncio.wait_for(
-            loop.run_in_executor(None, _sync_cleanup),
+            _run_in_executor(_sync_cleanup),
             timeout=TV_UPLOAD_TIMEOUT
         )
     except asyncio.TimeoutError:
@@ -408,16 +1260,208 @@ async def cleanup_stale_images_async(host: str, port: int):
         return False
 
 
+def _delete_art_chunked(tv, content_ids: list, tv_key: str, tag: str) -> tuple[list, list]:
+    """Delete art with the TV's list-delete in chunks of ``TV_DELETE_CHUNK``.
+
+    A chunk the TV does not confirm is retried one item at a time for the IDs
+    still in the art list; the chunk size then halves and grows back while
+    chunks succeed. Returns ``(deleted, failed)`` content IDs.
+    """
+    deleted, failed = [], []
+    pending = list(content_ids)
+    chunk = TV_DELETE_CHUNK
+    start = time.monotonic()
+    while pending:
+        batch, pending = pending[:chunk], pending[chunk:]
+        remaining = batch
+        if len(batch) > 1:
+            try:
+                with _timed('delete', tv=tv_key, items=len(batch)):
+                    confirmed = tv.delete_list(batch)
+            except Exception as e:
+                logger.debug(f'{tag} delete_list of {len(batch)} items failed: {e}')
+                confirmed = False
+            if confirmed:
+                deleted.extend(batch)
+                chunk = min(TV_DELETE_CHUNK, chunk * 2)
+                remaining = []
+            else:
+                chunk = max(1, chunk // 2)
+                try:
+                    on_tv = {art.get('content_id') for art in tv.available() or []}
+                    deleted.extend(cid for cid in batch if cid not in on_tv)
+                    remaining = [cid for cid in batch if cid in on_tv]
+                except Exception as e:
+                    logger.debug(f'{tag} Could not re-read art list: {e}')
+                if remaining:
+                    logger.info(f'{tag} Chunk not confirmed; deleting {len(remaining)} item(s) individually (chunk size now {chunk})')
+        for content_id in remaining:
+            try:
+                with _timed('delete', tv=tv_key):
+                    if not tv.delete(content_id):
+                        raise RuntimeError('TV rejected the delete')
+                deleted.append(content_id)
+            except Exception as e:
+                logger.warning(f'{tag} Failed to delete {content_id}: {e}')
+                failed.append(content_id)
+        done = len(deleted) + len(failed)
+        elapsed = time.monotonic() - start
+        logger.info(f'{tag} Progress: {done}/{len(content_ids)} ({len(failed)} failed, {done / elapsed if elapsed > 0 else 0:.1f} items/s)')
+        _report_job_progress(tv_key, done, len(content_ids), len(failed), elapsed)
+    return deleted, failed
+
+
+def _art_item_time(art: dict, owned: dict) -> datetime | None:
+    """When a TV art item was added: the owned-art index time, else the
+    item's ``image_date`` (``YYYY:MM:DD HH:MM:SS``)."""
+    for value, fmt in ((owned.get(art.get('content_id')), None), (art.get('image_date'), '%Y:%m:%d %H:%M:%S')):
+        if not value:
+            continue
+        try:
+            return datetime.fromisoformat(value) if fmt is None else datetime.strptime(value, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+async def reconcile_owned_art_async(host: str, port: int, max_deletions: int = TV_GC_BATCH) -> dict:
+    """Diff the TV's owned-art index against its art list (``available()``)
+    and delete orphans.
+
+    An orphan is art this add-on uploaded that is still on the TV but is not
+    the cached current image (e.g. a deletion that ran out of retries). At
+    most ``max_deletions`` orphans are deleted, oldest first; index entries
+    the TV no longer lists are dropped. User art the add-on never recorded is
+    only reported as ``untracked``.
+    """
+    tv_key = f'{host}:{port}'
+    result = {'time': datetime.now().isoformat(timespec='seconds'), 'success': False}
+
+    def _sync_reconcile():
+        """Synchronous reconciliation to run in executor."""
+        try:
+            with _tv_session(host, port) as tv:
+                if tv is None:
+                    result['message'] = 'TV does not support art mode'
+                    return result
+                art_list = tv.available() or []
+                on_tv = {art.get('content_id') for art in art_list if art.get('content_id')}
+                current = _read_last_art_id(host, port)
+                owned = _owned_art(tv_key)
+
+                gone = [cid for cid in owned if cid not in on_tv]
+                if gone:
+                    _forget_owned_art(tv_key, *gone)
+                    logger.debug(f'[TV GC] {tv_key}: {len(gone)} indexed image(s) no longer on TV')
+                orphans = sorted((cid for cid in owned if cid in on_tv and cid != current), key=owned.get)
+
+                deleted, failed = _delete_art_chunked(tv, orphans[:max_deletions], tv_key, f'[TV GC] {tv_key}:') if orphans else ([], [])
+                for content_id in deleted:
+                    _clear_deletion_retry(tv_key, content_id)
+                    METRIC_ART_GC_DELETIONS.inc(tv=tv_key)
+                if deleted:
+                    _forget_owned_art(tv_key, *deleted)
+                    logger.info(f'[TV GC] {tv_key}: Deleted {len(deleted)} orphaned image(s)')
+
+                result.update({
+                    'success': not failed,
+                    'on_tv': len(on_tv),
+                    'owned': len(owned) - len(gone) - len(deleted),
+                    'current': current,
+                    'deleted': deleted,
+                    'failed': failed,
+                    'dropped': len(gone),
+                    'remaining': len(orphans) - len(deleted) - len(failed),  # not attempted this pass
+                    'untracked': [
+                        art['content_id'] for art in art_list
+                        if art.get('category_id') == 'MY-C0002' and art.get('content_id')
+                        and art['content_id'] not in owned and art['content_id'] != current
+                    ],
+                })
+                return result
+        except Exception as e:
+            logger.error(f'[TV GC] ERROR: Exception during reconciliation of {tv_key}: {e}')
+            result['message'] = f'Error: {e}'
+            return result
+
+    try:
+        return await asyncio.wait_for(_run_in_executor(_sync_reconcile), timeout=TV_UPLOAD_TIMEOUT * 2)
+    except asyncio.TimeoutError:
+        logger.warning(f'[TV GC] {tv_key}: Reconciliation timed out after {TV_UPLOAD_TIMEOUT * 2}s')
+        return {**result, 'message': f'Timed out after {TV_UPLOAD_TIMEOUT * 2}s'}
+
+
+# Last reconciliation result and next due time (loop clock) per TV key
+_art_gc_status = {}
+_art_gc_due = {}
+
+
+async def _art_gc_target(target: TVTarget) -> dict:
+    """Reconcile one TV (caller holds its operation lock) and schedule its
+    next pass: at the next idle gap if orphans are left over from a full
+    batch, otherwise after ``TV_GC_INTERVAL``."""
+    result = await reconcile_owned_art_async(target.host, target.port)
+    now = asyncio.get_event_loop().time()
+    _art_gc_status[target.key] = result
+    _art_gc_due[target.key] = now if result.get('remaining') else now + max(TV_GC_INTERVAL, 0)
+    return result
+
+
+async def art_gc_pass() -> dict:
+    """Reconcile owned art on TVs whose pass is due.
+
+    Called by the upload worker when no frame is waiting.
+    """
+    if TV_GC_INTERVAL <= 0:
+        return {}
+    now = asyncio.get_event_loop().time()
+    # TVs backing off after failed uploads are likely unreachable; try them later
+    targets = [t for t in TV_TARGETS if now >= _art_gc_due.get(t.key, 0.0) and not _tv_backoff_remaining(t.key)]
+
+    async def _reconcile(target: TVTarget) -> dict:
+        async with _tv_op_lock(target.key):
+            return await _art_gc_target(target)
+
+    results = await asyncio.gather(*(_reconcile(t) for t in targets))
+    return {t.key: r for t, r in zip(targets, results)}
+
+
+# Startup cleanup per TV (key -> task); a TV's first upload waits for its cleanup
+_startup_cleanups = {}
+
+
 # Global browser and page instances for persistent rendering
 _browser = None
-_page = None
-_page_lock = asyncio.Lock()
+_pages = OrderedDict()  # page key -> pooled page entry, least recently used first
+_cache_stats = {'responses': 0, 'disk_cache': 0, 'memory_cache': 0, 'service_worker': 0}  # since add-on start
+_pages_lock = asyncio.Lock()
 
 # Status tracking for API
 _status_lock = asyncio.Lock()
 _last_sync_time = None
 _last_sync_success = False
 _last_error = None
+_skipped_uploads = 0
+
+# Most recent frame rendered/fetched from the primary target, and from every target URL
+_current_frame = None
+_frames = {}
+
+# Shared HTTP session and cached target classification per URL ('html' | 'image')
+_http_session = None
+_target_kinds = {}
+
+# Per-TV status and change detection state (last frame uploaded to each TV)
+_tv_status = {}
+_last_uploaded = {}  # tv key -> (sha256, signature)
+_signature_cache = (None, None)  # (sha256, signature) of the most recent frame
+
+# Home Assistant trigger state
+_capture_event = asyncio.Event()
+_trigger_handle = None
+_trigger_connected = False
+_last_trigger_entity = None
+_last_trigger_time = None
 
 # MQTT client and state
 _mqtt_client = None
@@ -425,9 +1469,64 @@ _mqtt_connected = False
 _mqtt_lock = asyncio.Lock()
 _main_loop = None  # Store main event loop for MQTT callbacks
 
-async def _ensure_browser(width: int, height: int):
-    """Ensure browser instance is running. Returns (browser, page)."""
-    global _browser, _page
+def _prepare_profile_dir():
+    """Create the persistent profile directory and clear stale singleton locks.
+
+    Chromium refuses to open a profile whose ``SingletonLock`` points at a
+    process that no longer exists (e.g. after a crash or container restart);
+    the add-on is the profile's only user, so the locks are always stale here.
+    """
+    BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    for name in ('SingletonLock', 'SingletonSocket', 'SingletonCookie'):
+        path = BROWSER_PROFILE_DIR / name
+        if path.is_symlink() or path.exists():
+            path.unlink()
+
+
+def _track_cache_hits(page):
+    """Count how a page's responses were served (network, HTTP cache, service worker)."""
+    def on_response(params):
+        response = params.get('response') or {}
+        _cache_stats['responses'] += 1
+        if response.get('fromServiceWorker'):
+            _cache_stats['service_worker'] += 1
+        elif response.get('fromDiskCache'):
+            _cache_stats['disk_cache'] += 1
+
+    def on_served_from_cache(params):
+        _cache_stats['memory_cache'] += 1
+
+    page._client.on('Network.responseReceived', on_response)
+    page._client.on('Network.requestServedFromCache', on_served_from_cache)
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(str(path)):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+async def _browser_cache_status() -> dict:
+    """Cache hit statistics and on-disk profile size for ``/status``."""
+    status = dict(_cache_stats)
+    responses = status['responses']
+    status['hit_ratio'] = round((status['disk_cache'] + status['service_worker']) / responses, 3) if responses else None
+    status['profile'] = str(BROWSER_PROFILE_DIR) if BROWSER_PERSISTENT_PROFILE else None
+    status['profile_bytes'] = None
+    if BROWSER_PERSISTENT_PROFILE and BROWSER_PROFILE_DIR.exists():
+        loop = asyncio.get_event_loop()
+        status['profile_bytes'] = await loop.run_in_executor(None, _dir_size, BROWSER_PROFILE_DIR)
+    return status
+
+
+async def _ensure_browser():
+    """Ensure browser instance is running. Returns the browser."""
+    global _browser
     
     # Check if browser is still connected
     if _browser is not None:
@@ -437,7 +1536,7 @@ async def _ensure_browser(width: int, height: int):
         except Exception:
             logger.debug('[BROWSER] Browser connection lost, relaunching...')
             _browser = None
-            _page = None
+            _pages.clear()
     
     if _browser is None:
         logger.debug('[BROWSER] Launching persistent browser instance...')
@@ -448,28 +1547,85 @@ async def _ensure_browser(width: int, height: int):
                 executable_path = cand
                 break
         
+        options = {'headless': True}
+        if executable_path:
+            options['executablePath'] = executable_path
+        if BROWSER_PERSISTENT_PROFILE:
+            try:
+                _prepare_profile_dir()
+                options['userDataDir'] = str(BROWSER_PROFILE_DIR)
+                options['args'] = [f'--disk-cache-size={BROWSER_CACHE_SIZE_MB * 1024 * 1024}']
+            except Exception as e:
+                logger.warning(f'[BROWSER] Could not use {BROWSER_PROFILE_DIR} ({e}); using a temporary profile')
+
         try:
-            if executable_path:
-                _browser = await pyppeteer.launch(headless=True, executablePath=executable_path)
-            else:
-                _browser = await pyppeteer.launch(headless=True)
+            _browser = await pyppeteer.launch(**options)
         except Exception:
-            args = ['--no-sandbox']
-            if executable_path:
-                _browser = await pyppeteer.launch(headless=True, executablePath=executable_path, args=args)
-            else:
-                _browser = await pyppeteer.launch(headless=True, args=args)
+            options['args'] = options.get('args', []) + ['--no-sandbox']
+            _browser = await pyppeteer.launch(**options)
         
+        METRIC_BROWSER_LAUNCHES.inc()
         logger.debug('[BROWSER] ✓ Browser launched successfully')
-        _page = None  # Force new page creation
-    
-    if _page is None:
-        logger.debug('[BROWSER] Creating new page...')
-        _page = await _browser.newPage()
-        await _page.setViewport({'width': width, 'height': height})
-        logger.debug('[BROWSER] ✓ Page created')
+        _pages.clear()  # Force new page creation
     
-    return _browser, _page
+    return _browser
+
+
+async def _close_page_entry(entry: dict):
+    """Close a pooled page, ignoring errors."""
+    try:
+        await entry['page'].close()
+    except Exception as e:
+        logger.debug(f'[BROWSER] Error closing page: {e}')
+
+
+async def _acquire_page(key: str, width: int, height: int) -> dict:
+    """Return the pool entry for ``key``, creating a page if needed.
+
+    Each entry holds its own page, lock, viewport, extra headers and the URL
+    it last navigated to.  When the pool is full the least recently used
+    idle page is closed to make room.
+    """
+    async with _pages_lock:
+        await _ensure_browser()
+
+        entry = _pages.get(key)
+        if entry is not None and entry['page'].isClosed():
+            logger.debug(f'[BROWSER] Pooled page for {key} was closed; recreating')
+            del _pages[key]
+            entry = None
+
+        if entry is None:
+            # Evict least recently used idle pages to stay within the pool size
+            for old_key in list(_pages):
+                if len(_pages) < BROWSER_PAGE_POOL_SIZE:
+                    break
+                old_entry = _pages[old_key]
+                if not old_entry['lock'].locked():
+                    logger.debug(f'[BROWSER] Evicting idle page for {old_key}')
+                    del _pages[old_key]
+                    await _close_page_entry(old_entry)
+
+            logger.debug(f'[BROWSER] Creating new page for {key}...')
+            page = await _browser.newPage()
+            _track_cache_hits(page)
+            await page.setViewport({'width': width, 'height': height})
+            entry = {
+                'page': page,
+                'lock': asyncio.Lock(),
+                'viewport': (width, height),
+                'headers': None,
+                'url': None,
+                'screencast': None,
+                'requests': None,
+                'created': time.monotonic(),
+                'perf_enabled': False,
+            }
+            _pages[key] = entry
+            logger.debug(f'[BROWSER] ✓ Page created ({len(_pages)}/{BROWSER_PAGE_POOL_SIZE} in pool)')
+
+        _pages.move_to_end(key)
+        return entry
 
 
 async def _reset_browser():
@@ -479,7 +1635,7 @@ async def _reset_browser():
     appears to hang.  The next call to :func:`_ensure_browser` will
     create a fresh process.
     """
-    global _browser, _page
+    global _browser
     if _browser:
         try:
             await _browser.close()
@@ -487,10 +1643,330 @@ async def _reset_browser():
         except Exception as e:
             logger.debug(f'[BROWSER] Error closing browser: {e}')
     _browser = None
-    _page = None
+    _pages.clear()
     logger.info('[BROWSER] Browser reset complete')
 
 
+async def _capture_screenshot(page) -> bytes:
+    """Capture the page's current viewport (or ``SCREENSHOT_CLIP``).
+
+    The ``cdp`` backend sends ``Page.captureScreenshot`` on the page's own
+    DevTools session. That skips pyppeteer's per-call target activation and
+    option handling. The base64 payload is decoded once, straight into the
+    returned bytes.
+    """
+    if SCREENSHOT_CAPTURE == 'pyppeteer':
+        options = {'type': SCREENSHOT_FORMAT}
+        if SCREENSHOT_FORMAT == 'jpeg':
+            options['quality'] = SCREENSHOT_QUALITY
+        if SCREENSHOT_CLIP_RECT:
+            options['clip'] = {k: v for k, v in SCREENSHOT_CLIP_RECT.items() if k != 'scale'}
+        return await page.screenshot(options)
+
+    params = {
+        'format': SCREENSHOT_FORMAT,
+        'fromSurface': True,
+        'optimizeForSpeed': SCREENSHOT_OPTIMIZE_FOR_SPEED,  # ignored by Chromium versions that predate it
+    }
+    if SCREENSHOT_FORMAT == 'jpeg':
+        params['quality'] = SCREENSHOT_QUALITY
+    if SCREENSHOT_CLIP_RECT:
+        params['clip'] = SCREENSHOT_CLIP_RECT
+    result = await page._client.send('Page.captureScreenshot', params)
+    return binascii.a2b_base64(result.pop('data'))
+
+
+# Screencast frames are acknowledged after this delay, which caps how often
+# Chromium sends them (it waits for the ack and then sends the latest frame)
+_SCREENCAST_ACK_DELAY = 1.0
+
+
+def _on_screencast_frame(entry: dict, client, params: dict):
+    """Keep the newest screencast frame of a pooled page."""
+    global _current_frame
+    cast = entry.get('screencast')
+    if not cast:
+        return
+    loop = asyncio.get_event_loop()
+    ack = {'sessionId': params.get('sessionId')}
+    loop.call_later(_SCREENCAST_ACK_DELAY, lambda: asyncio.ensure_future(client.send('Page.screencastFrameAck', ack)))
+    try:
+        data = binascii.a2b_base64(params['data'])
+    except Exception as e:
+        logger.debug(f'[SCREENCAST] Could not decode frame: {e}')
+        return
+    cast['data'] = data
+    cast['seq'] += 1
+    cast['time'] = datetime.now()
+
+    url = entry['url']
+    if not url:
+        return
+    if not _image_stage_enabled():
+        # The raw frame is exactly what the next cycle would upload; serve it right away
+        frame = _make_frame(data)
+        _frames[url] = frame
+        if _art_path_for(url) == ART_PATH:
+            _current_frame = frame
+    if SCREENSHOT_SCREENCAST_TRIGGER and cast['seq'] > 1:
+        _schedule_triggered_capture(f'screencast:{url}')
+
+
+async def _start_screencast(entry: dict, width: int, height: int) -> dict | None:
+    """Start ``Page.startScreencast`` on a pooled page's DevTools session."""
+    client = entry['page']._client
+    cast = {'data': None, 'seq': 0, 'served_seq': 0, 'time': None}
+    entry['screencast'] = cast
+
+    def handler(params):
+        _on_screencast_frame(entry, client, params)
+
+    client.on('Page.screencastFrame', handler)
+    try:
+        params = {'format': SCREENSHOT_FORMAT, 'maxWidth': width, 'maxHeight': height, 'everyNthFrame': 1}
+        if SCREENSHOT_FORMAT == 'jpeg':
+            params['quality'] = SCREENSHOT_QUALITY
+        await client.send('Page.startScreencast', params)
+        logger.debug(f'[SCREENCAST] Started for {entry["url"]}')
+        return cast
+    except Exception as e:
+        logger.warning(f'[SCREENCAST] Could not start screencast, using screenshots: {e}')
+        client.remove_listener('Page.screencastFrame', handler)
+        entry['screencast'] = None
+        return None
+
+
+# Hosts matched by the "analytics" pseudo resource type
+_ANALYTICS_PATTERNS = (
+    '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+    '*connect.facebook.net/*', '*hotjar.com/*', '*segment.io/*', '*segment.com/*',
+    '*mixpanel.com/*', '*plausible.io/*', '*matomo*', '*clarity.ms/*', '*sentry.io/*',
+)
+
+
+# Chromium's request interception never sees WebSocket handshakes, so the
+# "websocket" type is blocked in the page instead: the constructor is replaced
+# by one that fails like an unreachable server (error, then close 1006).
+_BLOCK_WEBSOCKET_JS = '''() => {
+    if (!window.WebSocket) return;
+    class BlockedWebSocket extends EventTarget {
+        constructor(url, protocols) {
+            super();
+            this.url = String(url);
+            this.readyState = 3;
+            this.protocol = '';
+            this.extensions = '';
+            this.bufferedAmount = 0;
+            this.binaryType = 'blob';
+            this.onopen = this.onmessage = this.onerror = this.onclose = null;
+            setTimeout(() => {
+                if (window._screenshotFrameWebSocketBlocked) window._screenshotFrameWebSocketBlocked(this.url);
+                const error = new Event('error');
+                if (this.onerror) this.onerror(error);
+                this.dispatchEvent(error);
+                const close = new CloseEvent('close', {code: 1006, reason: 'blocked', wasClean: false});
+                if (this.onclose) this.onclose(close);
+                this.dispatchEvent(close);
+            }, 0);
+        }
+        send() { throw new DOMException('WebSocket is blocked', 'InvalidStateError'); }
+        close() {}
+    }
+    Object.assign(BlockedWebSocket, {CONNECTING: 0, OPEN: 1, CLOSING: 2, CLOSED: 3});
+    window.WebSocket = BlockedWebSocket;
+}'''
+
+
+def _interception_enabled() -> bool:
+    return bool(RENDER_BLOCK_TYPES or RENDER_DENY_PATTERNS or RENDER_MAX_REQUESTS or RENDER_MAX_BYTES)
+
+
+def _new_request_stats() -> dict:
+    return {'total': 0, 'blocked': {}, 'bytes': 0, 'inflight': {}, 'slow': []}
+
+
+def _request_block_reason(url: str, resource_type: str, stats: dict) -> str | None:
+    """Return why a render request should be blocked, or ``None`` to let it through."""
+    if any(fnmatch.fnmatchcase(url, pattern) for pattern in RENDER_ALLOW_PATTERNS):
+        return None
+    if any(fnmatch.fnmatchcase(url, pattern) for pattern in RENDER_DENY_PATTERNS):
+        return 'pattern'
+    if resource_type in RENDER_BLOCK_TYPES:
+        return resource_type
+    if 'analytics' in RENDER_BLOCK_TYPES and any(fnmatch.fnmatchcase(url, p) for p in _ANALYTICS_PATTERNS):
+        return 'analytics'
+    if RENDER_MAX_REQUESTS and stats['total'] >= RENDER_MAX_REQUESTS:
+        return 'request_budget'
+    if RENDER_MAX_BYTES and stats['bytes'] >= RENDER_MAX_BYTES:
+        return 'byte_budget'
+    return None
+
+
+async def _settle_request(coro):
+    try:
+        await coro
+    except Exception as e:
+        logger.debug(f'[BROWSER] Could not settle intercepted request: {e}')
+
+
+def _finish_request(entry: dict, request):
+    """Note a finished or failed request and keep it if it was slow."""
+    stats = entry['requests']
+    started = stats['inflight'].pop(request, None)
+    if started is None:
+        return
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    if elapsed_ms >= RENDER_SLOW_REQUEST_MS:
+        stats['slow'].append({'url': request.url[:200], 'ms': elapsed_ms})
+
+
+async def _setup_interception(entry: dict):
+    """Enable request interception and stats collection on a pooled page."""
+    page = entry['page']
+    entry['requests'] = _new_request_stats()
+
+    def on_request(request):
+        stats = entry['requests']
+        # Never block the page itself
+        if request.isNavigationRequest() and request.frame is page.mainFrame:
+            reason = None
+        else:
+            reason = _request_block_reason(request.url, request.resourceType, stats)
+        if reason:
+            stats['blocked'][reason] = stats['blocked'].get(reason, 0) + 1
+            METRIC_REQUESTS_BLOCKED.inc(reason=reason)
+            asyncio.ensure_future(_settle_request(request.abort('blockedbyclient')))
+            return
+        stats['total'] += 1
+        stats['inflight'][request] = time.monotonic()
+        asyncio.ensure_future(_settle_request(request.continue_()))
+
+    def on_loading_finished(params):
+        entry['requests']['bytes'] += int(params.get('encodedDataLength') or 0)
+
+    def on_websocket_blocked(url):
+        entry['requests']['blocked']['websocket'] = entry['requests']['blocked'].get('websocket', 0) + 1
+        METRIC_REQUESTS_BLOCKED.inc(reason='websocket')
+
+    if 'websocket' in RENDER_BLOCK_TYPES:
+        await page.exposeFunction('_screenshotFrameWebSocketBlocked', on_websocket_blocked)
+        await page.evaluateOnNewDocument(_BLOCK_WEBSOCKET_JS)
+    page.on('request', on_request)
+    page.on('requestfinished', lambda request: _finish_request(entry, request))
+    page.on('requestfailed', lambda request: _finish_request(entry, request))
+    page._client.on('Network.loadingFinished', on_loading_finished)
+    await page.setRequestInterception(True)
+
+
+def _request_summary(stats: dict) -> dict:
+    """Summarise a render's request stats for the cycle trace."""
+    now = time.monotonic()
+    slow = list(stats['slow'])
+    for request, started in stats['inflight'].items():
+        elapsed_ms = int((now - started) * 1000)
+        if elapsed_ms >= RENDER_SLOW_REQUEST_MS:
+            slow.append({'url': request.url[:200], 'ms': elapsed_ms, 'pending': True})
+    slow.sort(key=lambda r: r['ms'], reverse=True)
+    return {
+        'requests': stats['total'],
+        'bytes': stats['bytes'],
+        'blocked': dict(stats['blocked']),
+        'slow': slow[:10],
+    }
+
+
+# Readiness predicates run in the page. Home Assistant renders almost everything
+# inside shadow roots, so element lookups walk open shadow roots too.
+_READY_SELECTOR_JS = '''(selector) => {
+    const find = (root) => {
+        if (root.querySelector(selector)) return true;
+        for (const el of root.querySelectorAll('*')) {
+            if (el.shadowRoot && find(el.shadowRoot)) return true;
+        }
+        return false;
+    };
+    return find(document);
+}'''
+
+_READY_IMAGES_JS = '''() => {
+    const images = [];
+    const collect = (root) => {
+        root.querySelectorAll('img').forEach((img) => images.push(img));
+        root.querySelectorAll('*').forEach((el) => el.shadowRoot && collect(el.shadowRoot));
+    };
+    collect(document);
+    // Off-screen lazy images never load; don't wait for them
+    const pending = images.filter((img) => img.complete || img.loading !== 'lazy');
+    return Promise.all(pending.map((img) => img.decode().catch(() => null))).then(() => pending.length);
+}'''
+
+_READY_QUIET_JS = '''(quietMs, timeoutMs) => new Promise((resolve) => {
+    const start = performance.now();
+    let last = start;
+    const bump = () => { last = performance.now(); };
+    const observers = [];
+    const watch = (root) => {
+        const observer = new MutationObserver(bump);
+        observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+        observers.push(observer);
+        root.querySelectorAll('*').forEach((el) => el.shadowRoot && watch(el.shadowRoot));
+    };
+    watch(document);
+    try {
+        const shifts = new PerformanceObserver(bump);
+        shifts.observe({type: 'layout-shift'});
+        observers.push(shifts);
+    } catch (e) {}
+    const check = () => {
+        const now = performance.now();
+        if (now - last >= quietMs || now - start >= timeoutMs) {
+            observers.forEach((observer) => observer.disconnect());
+            resolve(now - last >= quietMs);
+        } else {
+            setTimeout(check, Math.min(100, quietMs));
+        }
+    };
+    setTimeout(check, quietMs);
+})'''
+
+
+async def _check_ready_predicate(page, predicate: dict) -> bool:
+    """Wait for one readiness predicate; False when it timed out or failed."""
+    kind, value, timeout = predicate['type'], predicate['value'], predicate['timeout']
+    options = {'timeout': int(timeout * 1000), 'polling': 100}
+    try:
+        if kind == 'selector':
+            await page.waitForFunction(_READY_SELECTOR_JS, options, value)
+        elif kind == 'expression':
+            await page.waitForFunction(value, options)
+        elif kind == 'quiet_ms':
+            return bool(await asyncio.wait_for(page.evaluate(_READY_QUIET_JS, int(value), int(timeout * 1000)), timeout + 1))
+        elif kind == 'fonts':
+            await asyncio.wait_for(page.evaluate('() => document.fonts.ready.then(() => true)'), timeout)
+        elif kind == 'images':
+            await asyncio.wait_for(page.evaluate(_READY_IMAGES_JS), timeout)
+        return True
+    except Exception as e:
+        logger.debug(f'[BROWSER] Readiness predicate {kind} failed: {e!r}')
+        return False
+
+
+async def _wait_until_ready(page, url: str):
+    """Run the configured readiness predicates in order and record how long
+    the page took to become ready.  Unmet predicates are logged; the capture
+    goes ahead anyway, as it does after a navigation error.
+    """
+    with _timed('ready', target=url) as span:
+        results = []
+        for predicate in SCREENSHOT_READY:
+            started = time.monotonic()
+            ok = await _check_ready_predicate(page, predicate)
+            results.append({'type': predicate['type'], 'ok': ok, 'ms': int((time.monotonic() - started) * 1000)})
+            if not ok:
+                logger.warning(f'[BROWSER] Page not ready: {predicate["type"]} {predicate["value"]!r} not met within {predicate["timeout"]}s')
+        span['predicates'] = results
+
+
 async def render_url_with_pyppeteer(
     url: str,
     headers: dict | None = None,
@@ -498,35 +1974,56 @@ async def render_url_with_pyppeteer(
     height: int = SCREENSHOT_HEIGHT,
     zoom: int = SCREENSHOT_ZOOM,
     skip_navigation: bool = False,
+    page_key: str | None = None,
 ) -> bytes | None:
     """Render a URL in the persistent pyppeteer browser and return
     a screenshot as raw bytes.
 
     The helper is intentionally simple; callers (the screenshot loop)
-    are responsible for saving the returned bytes to disk.  A lock is
-    used to prevent multiple concurrent renders from stepping on each
-    other.  If anything goes wrong the function returns ``None``.
+    are responsible for saving the returned bytes to disk.  Each target
+    (``page_key``, defaulting to the URL) gets its own pooled page and
+    lock, so different targets render in parallel while renders of the
+    same target never step on each other.  ``skip_navigation`` only takes
+    effect once the page has loaded ``url``.  If anything goes wrong the
+    function returns ``None``.
     """
-    global _page, _page_lock
+    key = page_key or url
+    try:
+        entry = await _acquire_page(key, width, height)
+    except Exception as e:
+        logger.error(f'[BROWSER] render helper could not create page: {e}')
+        return None
 
-    async with _page_lock:
+    async with entry['lock']:
+        page = entry['page']
         try:
-            browser, page = await _ensure_browser(width, height)
-            if not page:
-                logger.error('[BROWSER] render helper could not create page')
-                return None
+            if entry['viewport'] != (width, height):
+                await page.setViewport({'width': width, 'height': height})
+                entry['viewport'] = (width, height)
 
             # Apply extra headers if provided
-            if headers:
+            if headers and headers != entry['headers']:
                 try:
                     await page.setExtraHTTPHeaders(headers)
+                    entry['headers'] = dict(headers)
                 except Exception as e:
                     logger.debug(f"[BROWSER] Failed to set headers: {e}")
 
+            if _interception_enabled():
+                if entry['requests'] is None:
+                    await _setup_interception(entry)
+                else:
+                    # Budgets and stats are per render
+                    entry['requests'].update(total=0, blocked={}, bytes=0, slow=[])
+
             # Navigate unless we're reusing the existing page view
-            if not skip_navigation:
+            if not skip_navigation or entry['url'] != url:
                 try:
-                    await page.goto(url, {'waitUntil': 'networkidle2', 'timeout': 30000})
+                    with _timed('navigate', target=url):
+                        # Readiness predicates decide when the page is done; otherwise wait for network idle
+                        wait_until = 'domcontentloaded' if SCREENSHOT_READY else 'networkidle2'
+                        await page.goto(url, {'waitUntil': wait_until, 'timeout': 30000})
+                    entry['url'] = url
                 except Exception as e:
                     logger.warning(f'[BROWSER] Navigation error: {e}')
                     # continue and attempt screenshot anyway
@@ -538,17 +2035,126 @@ async def render_url_with_pyppeteer(
                 except Exception as e:
                     logger.debug(f"[BROWSER] Zoom evaluation failed: {e}")
 
+            trace = _trace_var.get()
+            if entry['requests'] is not None and trace is not None:
+                trace['requests'][url] = _request_summary(entry['requests'])
+
+            # Screencast mode: the page repaints itself and pushes frames; no capture needed
+            if SCREENSHOT_SCREENCAST and skip_navigation and entry['url'] == url:
+                cast = entry['screencast'] or await _start_screencast(entry, width, height)
+                if cast and cast['data'] is not None:
+                    with _timed('screenshot', target=url, source='screencast') as span:
+                        span['bytes'] = len(cast['data'])
+                        span['repainted'] = cast['seq'] != cast['served_seq']
+                        cast['served_seq'] = cast['seq']
+                    return cast['data']
+
+            if SCREENSHOT_READY:
+                await _wait_until_ready(page, url)
+
             # Optional extra wait after network idle
             if SCREENSHOT_WAIT and SCREENSHOT_WAIT > 0:
                 await asyncio.sleep(SCREENSHOT_WAIT)
 
-            # Capture screenshot as JPEG
-            image_bytes = await page.screenshot({'type': 'jpeg', 'quality': 85})
+            with _timed('screenshot', target=url) as span:
+                image_bytes = await _capture_screenshot(page)
+                span['bytes'] = len(image_bytes)
             return image_bytes
 
         except Exception as e:
             logger.error(f'[BROWSER] render_url_with_pyppeteer exception: {e}')
             return None
+
+
+_watchdog_status = {'last_check': None, 'chromium_rss': None, 'pages': {}, 'recycles': deque(maxlen=20)}
+_last_watchdog_check = 0.0
+
+
+# Seconds a page may take to answer a metrics request before it counts as hung
+_PAGE_METRICS_TIMEOUT = 5.0
+
+
+async def _page_js_heap(entry: dict) -> int | None:
+    """JS heap used by a pooled page, from DevTools ``Performance.getMetrics``.
+
+    Raises ``asyncio.TimeoutError`` if the renderer does not answer within
+    ``_PAGE_METRICS_TIMEOUT`` (CDP sends have no timeout of their own).
+    """
+    client = entry['page']._client
+    try:
+        if not entry['perf_enabled']:
+            await asyncio.wait_for(client.send('Performance.enable', {}), _PAGE_METRICS_TIMEOUT)
+            entry['perf_enabled'] = True
+        result = await asyncio.wait_for(client.send('Performance.getMetrics', {}), _PAGE_METRICS_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise
+    except Exception as e:
+        logger.debug(f'[WATCHDOG] Could not read page metrics: {e}')
+        return None
+    metrics = {m['name']: m['value'] for m in result.get('metrics', [])}
+    return int(metrics['JSHeapUsedSize']) if 'JSHeapUsedSize' in metrics else None
+
+
+async def _recycle_page(key: str):
+    """Close a pooled page; the next render of its target opens and loads a fresh one."""
+    async with _pages_lock:
+        entry = _pages.pop(key, None)
+    if entry is None:
+        return
+    async with entry['lock']:
+        await _close_page_entry(entry)
+
+
+def _note_recycle(scope: str, key: str, reason: str, detail: str):
+    logger.warning(f'[WATCHDOG] Recycling {scope} {key}: {detail}')
+    METRIC_BROWSER_RECYCLES.inc(scope=scope, reason=reason)
+    _watchdog_status['recycles'].append({
+        'time': datetime.now().isoformat(), 'scope': scope, 'target': key, 'reason': reason, 'detail': detail,
+    })
+
+
+async def browser_memory_watchdog():
+    """Sample Chromium memory and recycle pages or the browser over their limits.
+
+    Called from the screenshot loop between cycles, so a recycle never
+    interrupts a capture; at most once per ``BROWSER_WATCHDOG_INTERVAL``.
+    """
+    global _last_watchdog_check
+    now = time.monotonic()
+    if _browser is None or now - _last_watchdog_check < BROWSER_WATCHDOG_INTERVAL:
+        return
+    _last_watchdog_check = now
+
+    loop = asyncio.get_event_loop()
+    rss = await loop.run_in_executor(None, _chromium_rss)
+    pages = {}
+    over_limit = []
+    for key, entry in list(_pages.items()):
+        age = now - entry['created']
+        try:
+            heap = await _page_js_heap(entry)
+        except asyncio.TimeoutError:
+            pages[key] = {'js_heap': None, 'age': int(age)}
+            over_limit.append((key, 'unresponsive', f'no metrics within {_PAGE_METRICS_TIMEOUT:g}s'))
+            continue
+        pages[key] = {'js_heap': heap, 'age': int(age)}
+        if heap is not None:
+            METRIC_PAGE_JS_HEAP.set(heap, target=key)
+        if PAGE_MAX_HEAP_MB and heap and heap > PAGE_MAX_HEAP_MB * 1024 * 1024:
+            over_limit.append((key, 'js_heap', f'JS heap {heap / 1048576:.0f} MB > {PAGE_MAX_HEAP_MB} MB'))
+        elif PAGE_MAX_AGE_HOURS and age > PAGE_MAX_AGE_HOURS * 3600:
+            over_limit.append((key, 'age', f'open for {age / 3600:.1f} h > {PAGE_MAX_AGE_HOURS} h'))
+    _watchdog_status.update(last_check=datetime.now().isoformat(), chromium_rss=rss, pages=pages)
+
+    if BROWSER_MAX_RSS_MB and rss and rss > BROWSER_MAX_RSS_MB * 1024 * 1024:
+        _note_recycle('browser', 'chromium', 'rss', f'RSS {rss / 1048576:.0f} MB > {BROWSER_MAX_RSS_MB} MB')
+        await _reset_browser()
+        return
+    for key, reason, detail in over_limit:
+        _note_recycle('page', key, reason, detail)
+        await _recycle_page(key)
+
+
 def _on_mqtt_connect(client, userdata, flags, rc):
     """MQTT connect callback."""
     global _mqtt_connected, _main_loop
@@ -659,161 +2265,1065 @@ async def _mqtt_update_status():
             logger.error(f'[MQTT] Error publishing status: {e}')
 
 
-async def _mqtt_connect():
-    """Initialize and connect MQTT client."""
-    global _mqtt_client, _mqtt_connected
-    
-    if not MQTT_ENABLED:
-        logger.info('[MQTT] MQTT integration is disabled')
+async def _mqtt_connect():
+    """Initialize and connect MQTT client."""
+    global _mqtt_client, _mqtt_connected
+    
+    if not MQTT_ENABLED:
+        logger.info('[MQTT] MQTT integration is disabled')
+        return
+    
+    try:
+        logger.info(f'[MQTT] Initializing MQTT client...')
+        _mqtt_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION1, client_id='screenshot_frame_addon')
+        _mqtt_client.on_connect = _on_mqtt_connect
+        _mqtt_client.on_disconnect = _on_mqtt_disconnect
+        
+        if MQTT_USERNAME and MQTT_PASSWORD:
+            _mqtt_client.username_pw_set(MQTT_USERNAME, MQTT_PASSWORD)
+            logger.info(f'[MQTT] Using authentication (username: {MQTT_USERNAME})')
+        
+        logger.info(f'[MQTT] Connecting to {MQTT_BROKER}:{MQTT_PORT}...')
+        # Connect from the network thread; _on_mqtt_connect publishes discovery
+        # once the broker answers, so startup doesn't wait on it
+        _mqtt_client.connect_async(MQTT_BROKER, MQTT_PORT, keepalive=60)
+        _mqtt_client.loop_start()
+        logger.info('[MQTT] ✓ MQTT client started; connecting in the background')
+        
+    except Exception as e:
+        logger.error(f'[MQTT] Failed to initialize MQTT: {e}')
+        import traceback
+        traceback.print_exc()
+        _mqtt_client = None
+
+
+async def _mqtt_disconnect():
+    """Disconnect MQTT client."""
+    global _mqtt_client, _mqtt_connected
+    
+    if _mqtt_client:
+        try:
+            _mqtt_client.loop_stop()
+            _mqtt_client.disconnect()
+            logger.debug('[MQTT] Disconnected')
+        except Exception:
+            pass
+        finally:
+            _mqtt_client = None
+            _mqtt_connected = False
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A rendered image held in memory and handed from render to upload to HTTP."""
+    data: bytes
+    sha256: str
+    timestamp: datetime
+    width: int | None = None
+    height: int | None = None
+    format: str = 'JPEG'
+
+    @property
+    def file_type(self) -> str:
+        """File type string expected by the TV upload API."""
+        return 'png' if self.format == 'PNG' else 'jpg'
+
+    @property
+    def content_type(self) -> str:
+        return 'image/png' if self.format == 'PNG' else 'image/jpeg'
+
+
+def _make_frame(data: bytes) -> Frame:
+    """Build a :class:`Frame` from image bytes.
+
+    Dimensions and format come from the image header only; Pillow does not
+    decode the pixel data here.
+    """
+    width = height = None
+    fmt = 'JPEG'
+    try:
+        from io import BytesIO
+        from PIL import Image
+        with Image.open(BytesIO(data)) as img:
+            width, height = img.size
+            fmt = img.format or fmt
+    except Exception as e:
+        logger.debug(f'[FRAME] Could not read image header: {e}')
+    return Frame(
+        data=data,
+        sha256=hashlib.sha256(data).hexdigest(),
+        timestamp=datetime.now(),
+        width=width,
+        height=height,
+        format=fmt,
+    )
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write ``data`` to ``path`` via a temp file and rename so readers
+    never observe a partially written file.  The directory is fsynced after
+    the rename so the new file also survives a power loss."""
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    with open(str(tmp_path), 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(str(tmp_path), str(path))
+    dir_fd = os.open(str(path.parent), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+async def _persist_bytes(path: Path, data: bytes) -> bool:
+    """Atomically write bytes to disk without blocking the event loop."""
+    loop = asyncio.get_event_loop()
+    try:
+        await loop.run_in_executor(None, _write_atomic, path, data)
+        logger.debug(f'[FRAME] Persisted {len(data)} bytes to {path}')
+        return True
+    except Exception as e:
+        logger.warning(f'[FRAME] Could not persist {path}: {e}')
+        return False
+
+
+# sha256 of the frame last written to each art path; identical frames are not rewritten
+_persisted_sha256 = {}
+
+
+def _prepare_image(data: bytes, width: int, height: int, fit: str, background: str,
+                   sharpen: float, to_srgb: bool):
+    """Decode a frame and convert it to an RGB image at the output size.
+
+    ``width``/``height`` of 0 keep the rendered size.
+    """
+    from io import BytesIO
+    from PIL import Image, ImageFilter, ImageOps
+
+    with Image.open(BytesIO(data)) as src:
+        img = src.copy()
+    icc_profile = img.info.get('icc_profile')
+    if to_srgb and icc_profile:
+        try:
+            from PIL import ImageCms
+            img = ImageCms.profileToProfile(
+                img,
+                ImageCms.ImageCmsProfile(BytesIO(icc_profile)),
+                ImageCms.createProfile('sRGB'),
+                outputMode='RGB',
+            )
+        except Exception:
+            pass  # littlecms not available or broken profile; keep the pixels as-is
+    if img.mode in ('RGBA', 'LA', 'P'):
+        rgba = img.convert('RGBA')
+        img = Image.new('RGB', rgba.size, background)
+        img.paste(rgba, mask=rgba.getchannel('A'))
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    size = (width or img.width, height or img.height)
+    if img.size != size:
+        if fit == 'crop':
+            img = ImageOps.fit(img, size, Image.Resampling.LANCZOS)
+        elif fit == 'stretch':
+            img = img.resize(size, Image.Resampling.LANCZOS)
+        else:
+            img = ImageOps.pad(img, size, Image.Resampling.LANCZOS, color=background)
+    if sharpen > 0:
+        img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=int(sharpen), threshold=2))
+    return img
+
+
+def _encode_jpeg(img, quality: int, subsampling: str) -> bytes:
+    from io import BytesIO
+    out = BytesIO()
+    # Optimized Huffman tables, baseline (the TV decodes progressive JPEGs slowly)
+    img.save(out, 'JPEG', quality=quality, optimize=True, progressive=False, subsampling=subsampling)
+    return out.getvalue()
+
+
+def _ssim(reference, data: bytes, block: int = 8) -> float:
+    """Mean SSIM of the luma channel of an encoded JPEG against ``reference``.
+
+    Computed over non-overlapping 8x8 windows at full resolution (JPEG block
+    artefacts would be smoothed away by downscaling first), using Pillow's
+    float image arithmetic so it stays in C.
+    """
+    from io import BytesIO
+    from PIL import Image, ImageMath
+
+    x = reference.convert('L').convert('F')
+    with Image.open(BytesIO(data)) as decoded:
+        y = decoded.convert('L').convert('F')
+
+    def window_mean(expr):
+        return ImageMath.lambda_eval(expr, x=x, y=y).reduce(block)
+
+    mx, my = x.reduce(block), y.reduce(block)
+    mxx, myy, mxy = window_mean(lambda a: a['x'] * a['x']), window_mean(lambda a: a['y'] * a['y']), window_mean(lambda a: a['x'] * a['y'])
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    ssim_map = ImageMath.lambda_eval(
+        lambda a: ((a['mx'] * a['my'] * 2 + c1) * ((a['mxy'] - a['mx'] * a['my']) * 2 + c2))
+        / ((a['mx'] * a['mx'] + a['my'] * a['my'] + c1) * (a['mxx'] - a['mx'] * a['mx'] + a['myy'] - a['my'] * a['my'] + c2)),
+        mx=mx, my=my, mxx=mxx, myy=myy, mxy=mxy,
+    )
+    # ImageStat bins float images into a histogram; sum the (small) map directly
+    return sum(ssim_map.getdata()) / (ssim_map.width * ssim_map.height)
+
+
+def _search_quality(accept, lo: int, hi: int, start: int) -> int | None:
+    """Largest quality in ``[lo, hi]`` for which ``accept`` holds.
+
+    ``accept`` must hold for every quality below some cut-off.  The first
+    probe is ``start`` (last cycle's answer) and the second its neighbour, so
+    a stable dashboard settles in two encodes instead of a full bisection.
+    """
+    best = None
+    probe = start
+    first = True
+    while lo <= hi:
+        probe = min(max(probe, lo), hi)
+        if accept(probe):
+            best, lo = probe, probe + 1
+            probe = lo if first else (lo + hi) // 2
+        else:
+            hi = probe - 1
+            probe = hi if first else (lo + hi) // 2
+        first = False
+    return best
+
+
+def _process_image(data: bytes, width: int, height: int, fit: str, background: str,
+                   sharpen: float, to_srgb: bool, quality: int, subsampling: str,
+                   max_bytes: int = 0, min_ssim: float = 0.0, min_quality: int = 1,
+                   hint: dict | None = None) -> tuple[bytes, dict]:
+    """Resize and re-encode one frame for the TV.
+
+    With ``max_bytes`` or ``min_ssim`` set, the JPEG quality is searched
+    between ``min_quality`` and ``quality``.  The result is the smallest
+    encode that reaches ``min_ssim`` while staying under ``max_bytes``.
+    If the budget cannot be met, 4:2:0 subsampling is tried as well.
+    ``hint`` is the previous result for this target and seeds the search.
+
+    Runs in an image worker process, so it only uses its arguments.  Returns
+    ``(jpeg_bytes, params)``.
+    """
+    img = _prepare_image(data, width, height, fit, background, sharpen, to_srgb)
+    if not max_bytes and not min_ssim:
+        return _encode_jpeg(img, quality, subsampling), {'quality': quality, 'subsampling': subsampling}
+
+    hint = hint or {}
+    lo = min(min_quality, quality)
+    candidates = [subsampling]
+    if max_bytes and subsampling != '4:2:0':
+        candidates.append('4:2:0')
+
+    encoded = {}
+
+    def encode(q, sub):
+        if (q, sub) not in encoded:
+            encoded[(q, sub)] = _encode_jpeg(img, q, sub)
+        return encoded[(q, sub)]
+
+    ssims = {}
+
+    def ssim(q, sub):
+        if (q, sub) not in ssims:
+            ssims[(q, sub)] = _ssim(img, encode(q, sub))
+        return ssims[(q, sub)]
+
+    chosen = None
+    for sub in candidates:
+        if hint.get('subsampling') == sub:
+            budget_start = hint.get('budget_quality', quality)
+            ssim_start = hint.get('quality', quality)
+        elif hint.get('subsampling') in candidates:
+            # The other mode was needed last time; a single probe re-checks this one
+            budget_start = ssim_start = lo
+        else:
+            budget_start = ssim_start = quality
+        q = quality
+        if max_bytes:
+            q = _search_quality(lambda x: len(encode(x, sub)) <= max_bytes, lo, quality, budget_start)
+            if q is None:
+                continue  # over budget even at the lowest quality
+        budget_q = q
+        if min_ssim:
+            # Lowest quality that still reaches the SSIM floor (never above the budget pick)
+            below = _search_quality(lambda x: ssim(x, sub) < min_ssim, lo, q, min(ssim_start, q) - 1)
+            # (if even the budget pick misses the floor, ``below`` is that pick)
+            q = lo if below is None else min(below + 1, budget_q)
+        chosen = (q, sub, budget_q)
+        break
+    if chosen is None:
+        chosen = (lo, candidates[-1], lo)  # best effort: smallest file we are allowed to produce
+
+    q, sub, budget_q = chosen
+    params = {'quality': q, 'subsampling': sub, 'encodes': len(encoded)}
+    if max_bytes:
+        params['budget_quality'] = budget_q
+    if min_ssim:
+        params['ssim'] = round(ssim(q, sub), 4)
+    return encode(q, sub), params
+
+
+_image_pool = None
+
+
+def _get_image_pool() -> ProcessPoolExecutor:
+    global _image_pool
+    if _image_pool is None:
+        _image_pool = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+    return _image_pool
+
+
+def _shutdown_image_pool():
+    global _image_pool
+    if _image_pool is not None:
+        _image_pool.shutdown(wait=False, cancel_futures=True)
+        _image_pool = None
+
+
+def _image_stage_enabled() -> bool:
+    return IMAGE_PROCESSING or IMAGE_MAX_BYTES > 0 or IMAGE_MIN_SSIM > 0
+
+
+# Encoder parameters chosen for each target on its last cycle (seeds the next quality search)
+_encode_params = {}
+# Last (input sha256, output) per target, so an unchanged capture is not re-encoded
+_postprocess_memo = {}
+
+
+async def postprocess_frame_bytes(data: bytes, url: str = TARGET_URL) -> bytes:
+    """Run the post-processing stage for one target's frame.
+
+    Returns ``data`` unchanged when post-processing is disabled or fails, so
+    a broken image worker never costs a cycle.
+    """
+    if not _image_stage_enabled():
+        return data
+    digest = hashlib.sha256(data).hexdigest()
+    memo = _postprocess_memo.get(url)
+    if memo and memo[0] == digest:
+        return memo[1]
+    budgeted = IMAGE_MAX_BYTES > 0 or IMAGE_MIN_SSIM > 0
+    if IMAGE_PROCESSING:
+        geometry = (IMAGE_OUTPUT_WIDTH, IMAGE_OUTPUT_HEIGHT, IMAGE_FIT, IMAGE_BACKGROUND, IMAGE_SHARPEN, IMAGE_CONVERT_SRGB)
+    else:
+        # Budget-only mode: keep the rendered size, only re-encode
+        geometry = (0, 0, IMAGE_FIT, IMAGE_BACKGROUND, 0.0, False)
+    job = functools.partial(
+        _process_image, data, *geometry,
+        IMAGE_JPEG_QUALITY, IMAGE_JPEG_SUBSAMPLING,
+        max_bytes=IMAGE_MAX_BYTES, min_ssim=IMAGE_MIN_SSIM, min_quality=IMAGE_MIN_QUALITY,
+        hint=_encode_params.get(url),
+    )
+    loop = asyncio.get_event_loop()
+    try:
+        with _timed('encode', target=url) as span:
+            processed, params = await loop.run_in_executor(_get_image_pool(), job)
+            span['bytes'] = len(processed)
+            span.update(params)
+        if budgeted:
+            _encode_params[url] = {**params, 'bytes': len(processed)}
+            if IMAGE_MAX_BYTES and len(processed) > IMAGE_MAX_BYTES:
+                logger.warning(f'[IMAGE] {url}: {len(processed)} bytes is over the {IMAGE_MAX_BYTES} byte budget even at quality {params["quality"]}')
+        logger.debug(f'[IMAGE] {len(data)} -> {len(processed)} bytes ({params})')
+        _postprocess_memo[url] = (digest, processed)
+        return processed
+    except Exception as e:
+        logger.warning(f'[IMAGE] Post-processing failed, uploading the frame as rendered: {e!r}')
+        METRIC_FAILURES.inc(stage='encode')
+        if isinstance(e, BrokenProcessPool):
+            # A crashed worker breaks the whole pool; start a fresh one next time
+            _shutdown_image_pool()
+        return data
+
+
+def _render_urls() -> list[str]:
+    """Distinct target URLs to render each cycle, primary target first."""
+    urls = [TARGET_URL] if TARGET_URL else []
+    for target in TV_TARGETS:
+        if target.url and target.url not in urls:
+            urls.append(target.url)
+    return urls
+
+
+def _art_path_for(url: str) -> Path:
+    """Persistence path for a target's frame (``ART_PATH`` for the primary)."""
+    urls = _render_urls()
+    if not urls or url == urls[0]:
+        return ART_PATH
+    digest = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return ART_PATH.with_name(f'art-{digest}.jpg')
+
+
+async def _publish_frame(data: bytes, url: str = TARGET_URL) -> Frame:
+    """Make ``data`` the current frame for ``url`` and persist it (unless the
+    same bytes were already written).
+
+    Byte-identical data keeps the existing frame, so its timestamp (and the
+    ``Last-Modified`` served for it) only moves when the content changes.
+    """
+    global _current_frame
+    previous = _frames.get(url)
+    if previous is not None and previous.sha256 == hashlib.sha256(data).hexdigest():
+        frame = previous
+    else:
+        frame = _make_frame(data)
+    _frames[url] = frame
+    METRIC_IMAGE_SIZE.set(len(data), target=url)
+    path = _art_path_for(url)
+    if path == ART_PATH:
+        _current_frame = frame
+    if _persisted_sha256.get(path) != frame.sha256 and await _persist_bytes(path, data):
+        _persisted_sha256[path] = frame.sha256
+    return frame
+
+
+async def _load_persisted_frame():
+    """Restore the last persisted frame from ``ART_PATH`` so ``/screenshot``
+    can serve it before the first cycle completes."""
+    global _current_frame
+
+    def _read():
+        try:
+            with open(str(ART_PATH), 'rb') as f:
+                return f.read()
+        except Exception:
+            return b''
+
+    loop = asyncio.get_event_loop()
+    data = await loop.run_in_executor(None, _read)
+    if data and _current_frame is None:
+        _current_frame = _make_frame(data)
+        _persisted_sha256[ART_PATH] = _current_frame.sha256
+        if _render_urls():
+            _frames.setdefault(_render_urls()[0], _current_frame)
+        logger.debug(f'[FRAME] Restored persisted frame from {ART_PATH} ({len(data)} bytes)')
+
+
+def _build_target_auth() -> tuple[dict, BasicAuth | None]:
+    """Build headers/auth for the target URL.
+
+    Built dynamically so the target URL can be Home Assistant (token header),
+    DakBoard (basic auth), or any other URL requiring custom headers.
+    """
+    headers = {}
+    auth = None
+    if TARGET_HEADERS:
+        try:
+            parsed = json.loads(TARGET_HEADERS)
+            if isinstance(parsed, dict):
+                headers.update(parsed)
+        except Exception:
+            logger.warning('Failed to parse TARGET_HEADERS; expecting JSON map')
+
+    if TARGET_AUTH_TYPE == 'bearer' and TARGET_TOKEN:
+        headers[TARGET_TOKEN_HEADER] = f"{TARGET_TOKEN_PREFIX} {TARGET_TOKEN}"
+    elif TARGET_AUTH_TYPE == 'basic' and TARGET_USERNAME and TARGET_PASSWORD:
+        auth = BasicAuth(TARGET_USERNAME, TARGET_PASSWORD)
+    return headers, auth
+
+
+async def _get_http_session() -> ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    The connector keeps connections alive across cycles and caches DNS
+    lookups so image targets don't pay a fresh TCP/TLS handshake each time.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=INTERVAL + 30)
+        _http_session = ClientSession(connector=connector)
+        logger.debug('[HTTP] Created pooled HTTP session')
+    return _http_session
+
+
+async def _close_http_session():
+    """Close the shared HTTP session."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        except Exception:
+            pass
+        _http_session = None
+
+
+def _remember_target_kind(url: str, kind: str | None):
+    """Cache the classification of a target URL ('html' or 'image').
+
+    Anything else clears the cache so the target is probed again next cycle.
+    """
+    if kind not in ('html', 'image'):
+        kind = None
+    previous = _target_kinds.get(url)
+    if kind != previous:
+        logger.debug(f'[HTTP] Target classification for {url}: {previous} -> {kind}')
+        if kind is None:
+            _target_kinds.pop(url, None)
+        else:
+            _target_kinds[url] = kind
+
+
+# Size of the greyscale thumbnail used for perceptual comparison
+_SIGNATURE_SIZE = (64, 36)
+
+
+def _frame_signature(data: bytes) -> bytes | None:
+    """Return a small greyscale thumbnail of an image for perceptual diffing.
+
+    Returns ``None`` when Pillow is unavailable or the image can't be decoded.
+    """
+    try:
+        from io import BytesIO
+        from PIL import Image
+    except Exception as e:
+        logger.debug(f'[CHANGE] Pillow not available: {e}')
+        return None
+
+    try:
+        with Image.open(BytesIO(data)) as img:
+            img.draft('L', (_SIGNATURE_SIZE[0] * 4, _SIGNATURE_SIZE[1] * 4))  # fast JPEG downscale on decode
+            return img.convert('L').resize(_SIGNATURE_SIZE).tobytes()
+    except Exception as e:
+        logger.debug(f'[CHANGE] Could not compute frame signature: {e}')
+        return None
+
+
+def _signature_difference(a: bytes, b: bytes) -> float:
+    """Mean absolute pixel difference between two signatures, in percent."""
+    if not a or not b or len(a) != len(b):
+        return 100.0
+    return sum(abs(x - y) for x, y in zip(a, b)) * 100.0 / (255 * len(a))
+
+
+async def _frame_signature_for(frame: Frame) -> bytes | None:
+    """Compute (once per frame) the perceptual signature of ``frame``."""
+    global _signature_cache
+    if _signature_cache[0] != frame.sha256:
+        loop = asyncio.get_event_loop()
+        signature = await loop.run_in_executor(None, _frame_signature, frame.data)
+        _signature_cache = (frame.sha256, signature)
+    return _signature_cache[1]
+
+
+async def _frame_changed(frame: Frame, tv_key: str) -> tuple[bool, str]:
+    """Decide whether ``frame`` differs from the last frame uploaded to a TV.
+
+    Returns ``(changed, reason)``.  The perceptual signature is only
+    computed when a threshold is configured.
+    """
+    previous_hash, previous_signature = _last_uploaded.get(tv_key, (None, None))
+    if previous_hash is None:
+        return True, 'no previous upload'
+    if frame.sha256 == previous_hash:
+        return False, 'identical content hash'
+    if SCREENSHOT_CHANGE_THRESHOLD <= 0:
+        return True, 'content hash changed'
+
+    signature = await _frame_signature_for(frame)
+    if signature is None or previous_signature is None:
+        return True, 'content hash changed (no signature)'
+    diff = _signature_difference(signature, previous_signature)
+    if diff < SCREENSHOT_CHANGE_THRESHOLD:
+        return False, f'perceptual difference {diff:.2f}% below {SCREENSHOT_CHANGE_THRESHOLD}%'
+    return True, f'perceptual difference {diff:.2f}%'
+
+
+async def _remember_uploaded_frame(frame: Frame, tv_key: str):
+    """Record the frame that is now displayed on a TV."""
+    signature = None
+    if SCREENSHOT_CHANGE_THRESHOLD > 0:
+        signature = await _frame_signature_for(frame)
+    _last_uploaded[tv_key] = (frame.sha256, signature)
+
+
+# Per-TV upload backoff: tv key -> {'failures', 'retry_at' (monotonic), 'error'}
+_tv_backoff = {}
+
+
+def _tv_backoff_remaining(tv_key: str) -> float:
+    """Seconds until a failing TV may be tried again (0 when not backing off)."""
+    backoff = _tv_backoff.get(tv_key)
+    return max(0.0, backoff['retry_at'] - time.monotonic()) if backoff else 0.0
+
+
+def _record_tv_upload_outcome(tv_key: str, error: str | None):
+    """Reset a TV's backoff after an upload, or extend it after a failure.
+
+    Mirrors ``AdaptiveScheduler``: the wait doubles from the minimum interval
+    per consecutive failure (with +/-20% jitter) up to ``SCHEDULE_BACKOFF_MAX``,
+    so an unreachable TV isn't tried, and waited on, for every new frame.
+    """
+    if error is None:
+        if _tv_backoff.pop(tv_key, None):
+            logger.info(f'[TV {tv_key}] Upload succeeded; backoff cleared')
+        return
+    failures = _tv_backoff.get(tv_key, {}).get('failures', 0) + 1
+    delay = min(SCHEDULE_BACKOFF_MAX, SCHEDULE_MIN_INTERVAL * 2 ** (failures - 1))
+    if failures > 1:
+        delay = min(SCHEDULE_BACKOFF_MAX, delay * random.uniform(0.8, 1.2))
+    _tv_backoff[tv_key] = {'failures': failures, 'retry_at': time.monotonic() + delay, 'error': error}
+    logger.warning(f'[TV {tv_key}] Upload failure #{failures}; not retrying for {delay:.0f}s')
+
+
+async def upload_frame_to_tvs(frames: dict) -> list[dict]:
+    """Upload the frames rendered this cycle to every configured TV concurrently.
+
+    ``frames`` maps target URL to :class:`Frame`; each TV receives the frame
+    of its own URL (or ``TARGET_URL``).  At most ``TV_UPLOAD_CONCURRENCY``
+    uploads run at once and each TV uses its own timeout.  TVs that already
+    show an equivalent frame are skipped, and TVs backing off after failed
+    uploads fail fast with reason ``backoff``.  Returns one result dict per
+    TV with ``status`` uploaded/skipped/failed.
+    """
+    semaphore = asyncio.Semaphore(TV_UPLOAD_CONCURRENCY)
+
+    async def _upload_one(target: TVTarget) -> dict:
+        result = {'tv': target.key, 'status': 'failed', 'content_id': None, 'error': None, 'reason': None}
+        frame = frames.get(target.url or TARGET_URL)
+        if frame is None:
+            result['error'] = 'No valid art saved from target URL'
+            await _record_tv_status(target, result)
+            return result
+        if SCREENSHOT_SKIP_UNCHANGED:
+            changed, result['reason'] = await _frame_changed(frame, target.key)
+            if not changed:
+                logger.info(f'[TV {target.key}] Frame unchanged ({result["reason"]}); skipping upload')
+                METRIC_UPLOADS_SKIPPED.inc(tv=target.key)
+                result['status'] = 'skipped'
+                await _record_tv_status(target, result)
+                return result
+            logger.debug(f'[TV {target.key}] Frame changed ({result["reason"]})')
+
+        retry_in = _tv_backoff_remaining(target.key)
+        if retry_in > 0:
+            backoff = _tv_backoff[target.key]
+            logger.debug(f'[TV {target.key}] Backing off after {backoff["failures"]} failed upload(s); next try in {retry_in:.0f}s')
+            result['reason'] = 'backoff'
+            result['error'] = f'{backoff["error"]} (backing off, next try in {retry_in:.0f}s)'
+            await _record_tv_status(target, result)
+            return result
+
+        cleanup = _startup_cleanups.pop(target.key, None)
+        if cleanup is not None:
+            # The cleanup deletes the cached last art ID; it must not see this upload's ID
+            await asyncio.gather(cleanup, return_exceptions=True)
+
+        tv_op_lock = _tv_op_lock(target.key)
+        if tv_op_lock.locked():
+            logger.info(f'[TV {target.key}] Waiting for a running TV job before uploading')
+        async with tv_op_lock, semaphore:
+            try:
+                content_id = await upload_image_to_tv_async(
+                    target.host, target.port, frame.data, target.matte, target.show,
+                    file_type=frame.file_type, timeout=target.timeout,
+                )
+            except Exception as e:
+                logger.error(f'[TV {target.key}] ERROR: Local TV upload error: {e}')
+                content_id = None
+                result['error'] = str(e)
+
+        if content_id:
+            logger.debug(f'[TV {target.key}] ✓ Upload complete with id: {content_id}')
+            result['status'] = 'uploaded'
+            result['content_id'] = content_id
+            await _remember_uploaded_frame(frame, target.key)
+        else:
+            METRIC_FAILURES.inc(stage='upload')
+            if not result['error']:
+                logger.warning(f'[TV {target.key}] WARNING: Async upload returned no id; upload may have failed')
+                result['error'] = 'Upload returned no ID'
+        _record_tv_upload_outcome(target.key, result['error'] if result['status'] == 'failed' else None)
+        await _record_tv_status(target, result)
+        return result
+
+    return list(await asyncio.gather(*(_upload_one(t) for t in TV_TARGETS)))
+
+
+async def _record_tv_status(target: TVTarget, result: dict):
+    """Update the per-TV status exposed by ``/status``."""
+    async with _status_lock:
+        status = _tv_status.setdefault(target.key, {'last_sync': None, 'content_id': None})
+        status['success'] = result['status'] != 'failed'
+        status['error'] = result['error']
+        status['last_result'] = result['status']
+        status['backoff_failures'] = _tv_backoff.get(target.key, {}).get('failures', 0)
+        if result['status'] != 'failed':
+            status['last_sync'] = datetime.now().isoformat()
+        if result['content_id']:
+            status['content_id'] = result['content_id']
+
+
+async def fetch_target_frame(url: str) -> tuple[Frame | None, bool]:
+    """Fetch or render one target URL and publish the resulting frame.
+
+    Returns ``(frame, success)``; ``frame`` is ``None`` when no valid art
+    was produced this cycle.
+    """
+    global _last_error
+    frame = None
+    success = True
+    try:
+        headers, auth = _build_target_auth()
+        kind = _target_kinds.get(url)
+        ctype = ''
+        content = None
+        if kind != 'html':
+            # Image targets are downloaded every cycle; unknown targets are probed once
+            session = await _get_http_session()
+            logger.debug(f'Fetching from target URL: {url} (auth={TARGET_AUTH_TYPE})')
+            with _timed('fetch', target=url) as span:
+                async with session.get(url, timeout=30, headers=headers or None, auth=auth) as resp:
+                    if resp.status == 200:
+                        ctype = (resp.headers.get('content-type') or '').lower()
+                        if ctype.startswith('text/html'):
+                            # The browser loads the page itself; don't download it twice
+                            kind = 'html'
+                        else:
+                            content = await resp.read()
+                            span['bytes'] = len(content)
+                            if len(content) > 0 and content.lstrip().startswith(b'<'):
+                                kind = 'html'
+                            elif ctype.startswith('image/'):
+                                kind = 'image'
+                            else:
+                                kind = 'other'
+                    else:
+                        logger.warning(f'Target URL returned status {resp.status}')
+                        METRIC_FAILURES.inc(stage='fetch')
+                        success = False
+                        kind = None
+                        # Do not overwrite art on non-200 responses; keep previous art
+            _remember_target_kind(url, kind)
+
+        if kind == 'html':
+            logger.debug('Target is HTML; attempting pyppeteer render')
+            # Skip navigation once the page has loaded if configured (for auto-refreshing pages)
+            rendered = await render_url_with_pyppeteer(
+                url,
+                headers=headers,
+                width=SCREENSHOT_WIDTH,
+                height=SCREENSHOT_HEIGHT,
+                zoom=SCREENSHOT_ZOOM,
+                skip_navigation=SCREENSHOT_SKIP_NAVIGATION,
+            )
+            if rendered:
+                frame = await _publish_frame(await postprocess_frame_bytes(rendered, url), url)
+                logger.debug(f'Saved pyppeteer-rendered image for {url}')
+            else:
+                METRIC_FAILURES.inc(stage='render')
+                # Re-validate the target type on the next cycle
+                _remember_target_kind(url, None)
+                if content:
+                    # Fallback: save the raw response (likely HTML) for debugging
+                    await _persist_bytes(DEBUG_RESPONSE_PATH, content)
+                    logger.warning(
+                        f'pyppeteer not available or failed; saved raw target response to {DEBUG_RESPONSE_PATH} (not marked as art)'
+                    )
+                else:
+                    logger.warning('pyppeteer not available or failed; keeping previous art')
+        elif kind == 'image':
+            frame = await _publish_frame(await postprocess_frame_bytes(content, url), url)
+            logger.debug(f'Saved image from target {url}')
+        elif kind == 'other':
+            # Save but don't mark as art
+            await _persist_bytes(DEBUG_RESPONSE_PATH, content)
+            logger.warning(
+                f'Received non-image content-type "{ctype}"; saved to {DEBUG_RESPONSE_PATH} for debugging (not marked as art)'
+            )
+    except Exception as e:
+        # log full traceback to help diagnose blank error messages
+        logger.error(f'Error fetching from target URL: {repr(e)}', exc_info=True)
+        METRIC_FAILURES.inc(stage='fetch')
+        _remember_target_kind(url, None)
+        async with _status_lock:
+            _last_error = str(e)
+        success = False
+    return frame, success
+
+
+def _entity_matches(entity_id: str) -> bool:
+    """Check an entity ID against the configured trigger entities/patterns."""
+    return any(fnmatch.fnmatchcase(entity_id, pattern) for pattern in TRIGGER_ENTITIES)
+
+
+def _schedule_triggered_capture(entity_id: str):
+    """Request a capture once watched entities have been quiet for
+    ``TRIGGER_DEBOUNCE`` seconds."""
+    global _trigger_handle, _last_trigger_entity, _last_trigger_time
+    _last_trigger_entity = entity_id
+    _last_trigger_time = datetime.now()
+    if _trigger_handle is not None:
+        _trigger_handle.cancel()
+    loop = asyncio.get_event_loop()
+    _trigger_handle = loop.call_later(TRIGGER_DEBOUNCE, _capture_event.set)
+    logger.debug(f'[TRIGGER] {entity_id} changed; capture in {TRIGGER_DEBOUNCE}s')
+
+
+async def ha_trigger_listener():
+    """Subscribe to Home Assistant ``state_changed`` events and schedule a
+    debounced capture whenever a watched entity changes.
+
+    Reconnects with exponential backoff if the websocket drops.
+    """
+    global _trigger_connected
+    if not TRIGGER_ENTITIES:
         return
-    
+    if not HA_TOKEN:
+        logger.warning('[TRIGGER] No Home Assistant token available; state-change triggers disabled')
+        return
+
+    backoff = 5
+    while True:
+        try:
+            session = await _get_http_session()
+            logger.debug(f'[TRIGGER] Connecting to {HA_WEBSOCKET_URL}')
+            async with session.ws_connect(HA_WEBSOCKET_URL, heartbeat=30) as ws:
+                msg = await ws.receive_json(timeout=30)
+                if msg.get('type') == 'auth_required':
+                    await ws.send_json({'type': 'auth', 'access_token': HA_TOKEN})
+                    msg = await ws.receive_json(timeout=30)
+                if msg.get('type') != 'auth_ok':
+                    raise RuntimeError(f'authentication failed: {msg.get("message") or msg.get("type")}')
+
+                await ws.send_json({'id': 1, 'type': 'subscribe_events', 'event_type': 'state_changed'})
+                msg = await ws.receive_json(timeout=30)
+                if not msg.get('success'):
+                    raise RuntimeError(f'subscribe failed: {msg.get("error")}')
+
+                _trigger_connected = True
+                backoff = 5
+                logger.info(f'[TRIGGER] ✓ Watching {len(TRIGGER_ENTITIES)} entity pattern(s) for changes')
+
+                async for ws_msg in ws:
+                    if ws_msg.type != WSMsgType.TEXT:
+                        continue
+                    data = json.loads(ws_msg.data)
+                    if data.get('type') != 'event':
+                        continue
+                    event_data = data.get('event', {}).get('data', {})
+                    entity_id = event_data.get('entity_id') or ''
+                    if not _entity_matches(entity_id):
+                        continue
+                    old_state = (event_data.get('old_state') or {}).get('state')
+                    new_state = (event_data.get('new_state') or {}).get('state')
+                    logger.debug(f'[TRIGGER] {entity_id}: {old_state} -> {new_state}')
+                    _schedule_triggered_capture(entity_id)
+            logger.warning('[TRIGGER] Home Assistant websocket closed')
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f'[TRIGGER] Home Assistant websocket error: {e!r}')
+        _trigger_connected = False
+        logger.debug(f'[TRIGGER] Reconnecting in {backoff}s')
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 300)
+
+
+async def _wait_for_next_cycle(timeout: float) -> bool:
+    """Sleep until the next scheduled cycle or a triggered capture.
+
+    Returns True when woken by a trigger.
+    """
     try:
-        logger.info(f'[MQTT] Initializing MQTT client...')
-        _mqtt_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION1, client_id='screenshot_frame_addon')
-        _mqtt_client.on_connect = _on_mqtt_connect
-        _mqtt_client.on_disconnect = _on_mqtt_disconnect
-        
-        if MQTT_USERNAME and MQTT_PASSWORD:
-            _mqtt_client.username_pw_set(MQTT_USERNAME, MQTT_PASSWORD)
-            logger.info(f'[MQTT] Using authentication (username: {MQTT_USERNAME})')
-        
-        logger.info(f'[MQTT] Connecting to {MQTT_BROKER}:{MQTT_PORT}...')
-        _mqtt_client.connect(MQTT_BROKER, MQTT_PORT, keepalive=60)
-        _mqtt_client.loop_start()
-        
-        # Give it a moment to connect
-        await asyncio.sleep(2)
-        
-        if _mqtt_connected:
-            logger.info('[MQTT] ✓ MQTT initialization complete')
+        await asyncio.wait_for(_capture_event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+class AdaptiveScheduler:
+    """Chooses the delay before the next capture cycle.
+
+    Consecutive unchanged frames stretch the interval by ``growth`` up to
+    ``maximum``; a changed frame drops it back to ``minimum``.  Failed cycles
+    back off exponentially (with +/-20% jitter) up to ``backoff_max`` so an
+    unreachable target or TV isn't hammered.  With ``minimum == maximum``
+    and no failures this is the plain fixed interval.
+    """
+
+    def __init__(self, minimum: int, maximum: int, backoff_max: int, growth: float = 1.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff_max = max(backoff_max, maximum)
+        self.growth = growth
+        self.interval = float(minimum)
+        self.failures = 0
+        self.unchanged_streak = 0
+        self.last_delay = float(minimum)
+        self.last_reason = 'initial'
+        self.next_cycle_at = None
+
+    def record(self, outcome: str) -> float:
+        """Record a cycle outcome ('changed', 'unchanged' or 'failed') and
+        return the delay in seconds before the next cycle."""
+        if outcome == 'failed':
+            self.failures += 1
+            backoff = min(self.backoff_max, self.interval * 2 ** (self.failures - 1))
+            delay = min(self.backoff_max, backoff * random.uniform(0.8, 1.2)) if self.failures > 1 else backoff
+            reason = f'failure #{self.failures}, backing off'
         else:
-            logger.warning('[MQTT] MQTT client started but not yet connected')
-        
-    except Exception as e:
-        logger.error(f'[MQTT] Failed to initialize MQTT: {e}')
-        import traceback
-        traceback.print_exc()
-        _mqtt_client = None
+            self.failures = 0
+            if outcome == 'unchanged':
+                self.unchanged_streak += 1
+                self.interval = min(self.maximum, self.interval * self.growth)
+                reason = f'{self.unchanged_streak} unchanged cycle(s)'
+            else:
+                self.unchanged_streak = 0
+                self.interval = float(self.minimum)
+                reason = 'frame changed'
+            delay = self.interval
+        self.last_delay = delay
+        self.last_reason = reason
+        return delay
 
+    def status(self) -> dict:
+        return {
+            'interval': round(self.interval, 1),
+            'next_delay': round(self.last_delay, 1),
+            'next_cycle': datetime.fromtimestamp(self.next_cycle_at).isoformat() if self.next_cycle_at else None,
+            'reason': self.last_reason,
+            'failures': self.failures,
+            'unchanged_streak': self.unchanged_streak,
+            'min_interval': self.minimum,
+            'max_interval': self.maximum,
+        }
 
-async def _mqtt_disconnect():
-    """Disconnect MQTT client."""
-    global _mqtt_client, _mqtt_connected
-    
-    if _mqtt_client:
+
+_scheduler = AdaptiveScheduler(SCHEDULE_MIN_INTERVAL, SCHEDULE_MAX_INTERVAL, SCHEDULE_BACKOFF_MAX)
+
+
+# Rendered frames waiting for the TV upload worker; depth 1, the latest frame wins
+_upload_queue = asyncio.Queue(maxsize=1)
+
+
+def _offer_latest(queue: asyncio.Queue, item):
+    """Put ``item`` into a depth-1 queue, replacing a pending (stale) item."""
+    if queue.full():
+        stale_cycle, _ = queue.get_nowait()
+        METRIC_FRAMES_SUPERSEDED.inc()
+        logger.info(f'[LOOP] TV upload still busy; frames of cycle #{stale_cycle} superseded by cycle #{item[0]}')
+    queue.put_nowait(item)
+
+
+async def tv_upload_worker(queue: asyncio.Queue = _upload_queue):
+    """Consumer half of the loop: upload the newest rendered frames to the TVs.
+
+    Runs beside the render loop, so a slow TV only delays uploads; frames
+    rendered in the meantime replace the pending ones and the TV never gets
+    an out-of-date frame. Each upload is traced as its own ``upload`` record.
+    When no frame is waiting, the art GC pass runs here, since it contends
+    with uploads for the TVs rather than with rendering.
+    """
+    global _last_sync_time, _last_sync_success, _last_error, _skipped_uploads
+    consecutive_failures = {}  # tv key -> failed upload attempts in a row
+
+    while True:
+        cycle, frames = await queue.get()
+        trace = _new_trace(cycle, kind='upload')
+        logger.debug(f'[LOOP] TV upload enabled, uploading cycle #{cycle} to {len(TV_TARGETS)} TV(s)')
         try:
-            _mqtt_client.loop_stop()
-            _mqtt_client.disconnect()
-            logger.debug('[MQTT] Disconnected')
-        except Exception:
-            pass
-        finally:
-            _mqtt_client = None
-            _mqtt_connected = False
+            results = await upload_frame_to_tvs(frames)
+        except Exception as e:
+            logger.error(f'[LOOP] ERROR: TV upload of cycle #{cycle} failed: {e}')
+            results = [{'tv': t.key, 'status': 'failed', 'content_id': None, 'error': str(e), 'reason': None} for t in TV_TARGETS]
+        failures = [r for r in results if r['status'] == 'failed']
+        for r in results:
+            trace['tvs'][r['tv']] = {k: r[k] for k in ('status', 'reason', 'error', 'content_id')}
+        async with _status_lock:
+            if failures:
+                _last_sync_success = False
+                _last_error = '; '.join(f"{r['tv']}: {r['error']}" for r in failures)
+            else:
+                _last_sync_time = datetime.now()
+                _last_sync_success = True
+                _last_error = None
+            if all(r['status'] == 'skipped' for r in results):
+                _skipped_uploads += 1
+        await _mqtt_update_status()
+
+        if failures:
+            trace['outcome'] = 'failed'
+            trace['error'] = _last_error
+        else:
+            trace['outcome'] = 'skipped' if all(r['status'] == 'skipped' for r in results) else 'uploaded'
+        await _finish_trace(trace)
+
+        # TVs skipped while backing off made no attempt; they don't count towards recovery
+        failing = []
+        for target, r in zip(TV_TARGETS, results):
+            if r['status'] != 'failed':
+                consecutive_failures.pop(target.key, None)
+            elif r['reason'] != 'backoff':
+                consecutive_failures[target.key] = consecutive_failures.get(target.key, 0) + 1
+                if consecutive_failures[target.key] >= 3:
+                    failing.append(target)
+        if failing:
+            logger.warning(f'[LOOP] Several consecutive upload failures on {", ".join(t.key for t in failing)} – resetting their TV state')
+            # drop those TVs' connections and remove their tokens to force re-auth on next upload
+            await _reset_tv_connections(failing)
+            for target in failing:
+                consecutive_failures.pop(target.key, None)
+                try:
+                    os.remove(_tv_token_file(target.host, target.port))
+                except Exception:
+                    pass
+
+        # Idle until the next frame: bound TV storage by deleting orphaned uploads in small batches
+        if queue.empty():
+            try:
+                await art_gc_pass()
+            except Exception as e:
+                logger.warning(f'[TV GC] Reconciliation pass failed: {e}')
 
 
 async def screenshot_loop():
     logger.debug('[LOOP] Screenshot loop started')
-    if not TARGET_URL:
+    if not _render_urls():
         logger.warning('[LOOP] WARNING: No TARGET_URL configured; the add-on will not fetch screenshots')
 
     global _last_sync_time, _last_sync_success, _last_error
     loop_count = 0
     next_cycle_time = None
     consecutive_failures = 0
+    previous_hashes = {}
 
     while True:
         loop_count += 1
         cycle_start = asyncio.get_event_loop().time()
         logger.debug(f'\n[LOOP] ===== Cycle #{loop_count} started =====')
+        METRIC_CYCLES.inc()
+        trace = _new_trace(loop_count)
         cycle_success = True  # assume success unless we hit an error
-        saved_art = False
+        frames = {}
+        # Changes arriving from here on are not guaranteed to be in this capture
+        _capture_event.clear()
 
-        try:
-            if not TARGET_URL:
-                logger.debug('[LOOP] Skipping fetch; TARGET_URL not set')
-            else:
-                try:
-                    # Build headers/auth dynamically so the target URL can be
-                    # Home Assistant (token header), DakBoard (basic auth), or
-                    # any other URL requiring custom headers.
-                    headers = {}
-                    auth = None
-                    if TARGET_HEADERS:
-                        try:
-                            parsed = json.loads(TARGET_HEADERS)
-                            if isinstance(parsed, dict):
-                                headers.update(parsed)
-                        except Exception:
-                            logger.warning('Failed to parse TARGET_HEADERS; expecting JSON map')
-
-                    if TARGET_AUTH_TYPE == 'bearer' and TARGET_TOKEN:
-                        headers[TARGET_TOKEN_HEADER] = f"{TARGET_TOKEN_PREFIX} {TARGET_TOKEN}"
-                    elif TARGET_AUTH_TYPE == 'basic' and TARGET_USERNAME and TARGET_PASSWORD:
-                        auth = BasicAuth(TARGET_USERNAME, TARGET_PASSWORD)
-
-                    async with ClientSession() as session:
-                        logger.debug(f'Fetching from target URL: {TARGET_URL} (auth={TARGET_AUTH_TYPE})')
-                        async with session.get(TARGET_URL, timeout=30, headers=headers or None, auth=auth) as resp:
-                            if resp.status == 200:
-                                ctype = (resp.headers.get('content-type') or '').lower()
-                                content = await resp.read()
-                                # If the target returns HTML, render it with pyppeteer
-                                if ctype.startswith('text/html') or (len(content) > 0 and content.lstrip().startswith(b'<')):
-                                    logger.debug('Target returned HTML; attempting pyppeteer render')
-                                    # Skip navigation after first load if configured (for auto-refreshing pages)
-                                    skip_nav = SCREENSHOT_SKIP_NAVIGATION and loop_count > 1
-                                    rendered = await render_url_with_pyppeteer(
-                                        TARGET_URL,
-                                        headers=headers,
-                                        width=SCREENSHOT_WIDTH,
-                                        height=SCREENSHOT_HEIGHT,
-                                        zoom=SCREENSHOT_ZOOM,
-                                        skip_navigation=skip_nav,
-                                    )
-                                    if rendered:
-                                        with open(str(ART_PATH), 'wb') as f:
-                                            f.write(rendered)
-                                        saved_art = True
-                                        logger.debug(f'Saved pyppeteer-rendered image to {ART_PATH}')
-                                    else:
-                                        # Fallback: save the raw response (likely HTML) for debugging
-                                        with open(str(ART_PATH), 'wb') as f:
-                                            f.write(content)
-                                        logger.warning(
-                                            f'pyppeteer not available or failed; saved raw target response to {ART_PATH} (not marked as art)'
-                                        )
-                                else:
-                                    # If content-type looks like an image, accept it. Otherwise save but don't mark as art.
-                                    if ctype.startswith('image/'):
-                                        with open(str(ART_PATH), 'wb') as f:
-                                            f.write(content)
-                                        saved_art = True
-                                        logger.debug(f'Saved image from target to {ART_PATH}')
-                                    else:
-                                        with open(str(ART_PATH), 'wb') as f:
-                                            f.write(content)
-                                        logger.warning(
-                                            f'Received non-image content-type "{ctype}"; saved to {ART_PATH} for debugging (not marked as art)'
-                                        )
-                            else:
-                                logger.warning(f'Target URL returned status {resp.status}')
-                                cycle_success = False
-                                # Do not overwrite art on non-200 responses; keep previous art
-                except Exception as e:
-                    # log full traceback to help diagnose blank error messages
-                    logger.error(f'Error fetching from target URL: {repr(e)}', exc_info=True)
-                    async with _status_lock:
-                        _last_error = str(e)
+        urls = _render_urls()
+        if not urls:
+            logger.debug('[LOOP] Skipping fetch; TARGET_URL not set')
+        else:
+            # Different targets render in parallel on their own pooled pages
+            results = await asyncio.gather(*(fetch_target_frame(url) for url in urls))
+            for url, (frame, ok) in zip(urls, results):
+                if frame is not None:
+                    frames[url] = frame
+                if not ok:
                     cycle_success = False
-        except Exception as e:
-            logger.error(f'Fetch loop error: {repr(e)}', exc_info=True)
-            async with _status_lock:
-                _last_error = str(e)
-            cycle_success = False
+                trace['targets'][url] = {
+                    'ok': ok,
+                    'bytes': len(frame.data) if frame else None,
+                    'sha256': frame.sha256[:16] if frame else None,
+                }
+        frames_changed = any(previous_hashes.get(url) != frame.sha256 for url, frame in frames.items())
+        previous_hashes.update((url, frame.sha256) for url, frame in frames.items())
 
-        if TV_IP:
-            if not saved_art:
+        if TV_TARGETS:
+            if not frames:
                 logger.warning(
                     '[LOOP] Skipping TV upload: no valid art saved this cycle (possible HTTP error or non-image response)'
                 )
@@ -823,37 +3333,12 @@ async def screenshot_loop():
                 await _mqtt_update_status()
                 cycle_success = False
             else:
-                logger.debug(f'[LOOP] TV upload enabled, uploading to {TV_IP}:{TV_PORT}')
-                try:
-                    content_id = await upload_image_to_tv_async(
-                        TV_IP, TV_PORT, str(ART_PATH), TV_MATTE, TV_SHOW_AFTER_UPLOAD
-                    )
-                    if not content_id:
-                        logger.warning('[LOOP] WARNING: Async upload returned no id; upload may have failed')
-                        async with _status_lock:
-                            _last_sync_success = False
-                            _last_error = 'Upload returned no ID'
-                        cycle_success = False
-                    else:
-                        logger.debug(f'[LOOP] ✓ Upload complete with id: {content_id}')
-                        async with _status_lock:
-                            _last_sync_time = datetime.now()
-                            _last_sync_success = True
-                            _last_error = None
-                        await _mqtt_update_status()
-                except Exception as e:
-                    logger.error(f'[LOOP] ERROR: Local TV upload error: {e}')
-                    import traceback
-                    traceback.print_exc()
-                    async with _status_lock:
-                        _last_sync_success = False
-                        _last_error = str(e)
-                    await _mqtt_update_status()
-                    cycle_success = False
+                # Hand the frames to the upload worker; rendering carries on on schedule
+                _offer_latest(_upload_queue, (loop_count, frames))
         else:
             logger.debug('[LOOP] TV upload disabled (use_local_tv=false or tv_ip not set)')
             # Still mark as success if just fetching (no TV upload)
-            if TARGET_URL:
+            if urls:
                 async with _status_lock:
                     _last_sync_time = datetime.now()
                     _last_sync_success = True
@@ -867,32 +3352,46 @@ async def screenshot_loop():
             consecutive_failures += 1
             if consecutive_failures >= 3:
                 # after several failed cycles try to reset things to recover
+                # (TV state is reset by the upload worker on its own failures)
                 logger.warning(
-                    '[LOOP] Several consecutive failures detected – resetting browser and TV state'
+                    '[LOOP] Several consecutive failures detected – resetting browser state'
                 )
                 await _reset_browser()
-                # remove TV token to force re-auth on next upload
-                try:
-                    os.remove('/data/tv-token.txt')
-                except Exception:
-                    pass
                 consecutive_failures = 0
 
         # Calculate cycle duration and next cycle time
         cycle_end = asyncio.get_event_loop().time()
         cycle_duration = cycle_end - cycle_start
         
-        # Calculate when next cycle should start (fixed interval from cycle start)
+        # Let the scheduler pick the interval from this cycle's outcome
+        if not cycle_success:
+            outcome = 'failed'
+        else:
+            outcome = 'changed' if frames_changed else 'unchanged'
+        delay = _scheduler.record(outcome)
+        trace['outcome'] = outcome
+        if not cycle_success:
+            trace['error'] = _last_error
+        await _finish_trace(trace)
+        # Between cycles: recycle leaking pages/browser before the next capture needs them
+        try:
+            await browser_memory_watchdog()
+        except Exception as e:
+            logger.warning(f'[WATCHDOG] Memory check failed: {e}')
+        logger.debug(f'[LOOP] Next interval {delay:.1f}s ({_scheduler.last_reason})')
+
+        # Calculate when next cycle should start (interval from cycle start)
         if next_cycle_time is None:
             # First cycle: schedule next one from now
-            next_cycle_time = cycle_start + INTERVAL
+            next_cycle_time = cycle_start + delay
         else:
             # Subsequent cycles: schedule from previous target time
-            next_cycle_time += INTERVAL
+            next_cycle_time += delay
         
         # Calculate sleep time
         current_time = asyncio.get_event_loop().time()
         sleep_time = next_cycle_time - current_time
+        _scheduler.next_cycle_at = datetime.now().timestamp() + max(0.0, sleep_time)
         
         if sleep_time > 0:
             logger.debug(
@@ -900,7 +3399,10 @@ async def screenshot_loop():
                 f'Sleeping {sleep_time:.1f}s until next cycle...'
             )
             logger.debug(f'[LOOP] ===== Cycle #{loop_count} ended =====\n')
-            await asyncio.sleep(sleep_time)
+            if await _wait_for_next_cycle(sleep_time):
+                logger.debug(f'[LOOP] Woken early by {_last_trigger_entity} change')
+                # The interval is a staleness bound measured from the triggered cycle
+                next_cycle_time = None
         else:
             # We're running behind schedule
             logger.warning(
@@ -915,45 +3417,329 @@ async def screenshot_loop():
 async def handle_status(request):
     """API endpoint: GET /status - Returns JSON with sync status and timestamp."""
     global _last_sync_time, _last_sync_success, _last_error
-    
+
+    browser_cache = await _browser_cache_status()
     async with _status_lock:
         return web.json_response({
             'last_sync': _last_sync_time.isoformat() if _last_sync_time else None,
             'success': _last_sync_success,
             'error': _last_error,
+            'skipped_uploads': _skipped_uploads,
+            'tvs': _tv_status,
+            'schedule': _scheduler.status(),
+            'encoder': _encode_params,
+            'browser_cache': browser_cache,
+            'browser_watchdog': {**_watchdog_status, 'recycles': list(_watchdog_status['recycles'])},
+            'screencast': {
+                entry['url']: {
+                    'frames': entry['screencast']['seq'],
+                    'last_frame': entry['screencast']['time'].isoformat() if entry['screencast']['time'] else None,
+                }
+                for entry in _pages.values() if entry['screencast']
+            },
+            'trigger': {
+                'entities': TRIGGER_ENTITIES,
+                'connected': _trigger_connected,
+                'last_entity': _last_trigger_entity,
+                'last_time': _last_trigger_time.isoformat() if _last_trigger_time else None,
+            },
             'timestamp': datetime.now().isoformat()
         })
 
 
+async def handle_status_history(request):
+    """API endpoint: GET /status/history?limit=N - Recent cycle traces, newest first."""
+    try:
+        limit = int(request.query.get('limit', '20'))
+    except ValueError:
+        return web.json_response({'error': 'limit must be an integer'}, status=400)
+    limit = max(0, min(limit, TRACE_HISTORY_SIZE))
+    records = list(_trace_history)[-limit:] if limit else []
+    return web.json_response({'cycles': records[::-1], 'size': len(_trace_history), 'capacity': TRACE_HISTORY_SIZE})
+
+
+async def handle_metrics(request):
+    """API endpoint: GET /metrics - Prometheus metrics."""
+    loop = asyncio.get_event_loop()
+    # Sampling the Chromium process tree walks /proc; keep it off the event loop
+    body = await loop.run_in_executor(None, render_metrics)
+    return web.Response(text=body, content_type='text/plain', charset='utf-8', headers={'X-Content-Type-Options': 'nosniff'})
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match / If-Range header value against an ETag."""
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == '*' or candidate == etag:
+            return True
+    return False
+
+
 async def handle_screenshot(request):
-    """API endpoint: GET /screenshot - Returns current screenshot image."""
+    """API endpoint: GET /screenshot - Returns current screenshot image.
+
+    The body is served from the in-memory frame.  Responses carry an ETag
+    and Last-Modified derived from the frame so polling clients get a
+    ``304 Not Modified`` while it is unchanged, and byte ranges are honoured.
+    """
     try:
-        if ART_PATH.exists():
-            with open(str(ART_PATH), 'rb') as f:
-                data = f.read()
-            return web.Response(body=data, content_type='image/jpeg')
-        else:
+        frame = _current_frame
+        selected = request.query.get('tv')
+        if selected:
+            targets = [t for t in TV_TARGETS if selected in (t.host, t.key)]
+            if not targets:
+                return web.Response(status=404, text='Unknown TV')
+            frame = _frames.get(targets[0].url or TARGET_URL)
+        if frame is None:
             return web.Response(status=404, text='Screenshot not yet available')
+
+        etag = f'"{frame.sha256[:32]}"'
+        modified = int(frame.timestamp.timestamp())
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+            'Accept-Ranges': 'bytes',
+        }
+
+        # Conditional GET: If-None-Match takes precedence over If-Modified-Since
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, etag)
+        else:
+            since = request.if_modified_since
+            not_modified = since is not None and modified <= int(since.timestamp())
+        if not_modified:
+            response = web.Response(status=304, headers=headers)
+            response.last_modified = modified
+            return response
+
+        body = memoryview(frame.data)
+        status = 200
+        if_range = request.headers.get('If-Range')
+        if 'Range' in request.headers and (if_range is None or _etag_matches(if_range, etag)):
+            total = len(body)
+            try:
+                rng = request.http_range
+            except ValueError:
+                rng = None
+            if rng is not None:
+                start, stop, _ = rng.indices(total)
+                if start >= stop:
+                    headers['Content-Range'] = f'bytes */{total}'
+                    return web.Response(status=416, headers=headers)
+                body = body[start:stop]
+                status = 206
+                headers['Content-Range'] = f'bytes {start}-{stop - 1}/{total}'
+
+        response = web.Response(body=body, status=status, headers=headers, content_type=frame.content_type)
+        response.last_modified = modified
+        return response
     except Exception as e:
         logger.error(f'[API] Error serving screenshot: {e}')
         return web.Response(status=500, text=f'Error: {e}')
 
 
+def _requested_tv_targets(request) -> list[TVTarget]:
+    """Return the TVs selected by the optional ``?tv=host[:port]`` query
+    parameter (all configured TVs when absent)."""
+    selected = request.query.get('tv')
+    if not selected:
+        return list(TV_TARGETS)
+    return [t for t in TV_TARGETS if selected in (t.host, t.key)]
+
+
+# ---------------------------------------------------------------------------
+# Background jobs for long TV operations (cleanup, delete-all)
+# ---------------------------------------------------------------------------
+
+_JOB_HISTORY_SIZE = 20  # finished jobs kept for GET /jobs
+_jobs = {}  # job id -> job dict, oldest first
+_job_var = contextvars.ContextVar('tv_job', default=None)
+
+
+def _job_view(job: dict) -> dict:
+    """Public (JSON-serializable) part of a job."""
+    return {k: v for k, v in job.items() if not k.startswith('_')}
+
+
+def _publish_job(job: dict):
+    """Push the job's current state to its event-stream subscribers."""
+    view = _job_view(job)
+    for queue in list(job['_subscribers']):
+        queue.put_nowait(view)
+
+
+def _update_job_tv(job: dict, tv_key: str, **progress):
+    job['tvs'][tv_key].update(progress)
+    _publish_job(job)
+
+
+def _report_job_progress(tv_key: str, done: int, total: int, failed: int, elapsed: float):
+    """Publish bulk-operation progress to the job running this code, if any.
+
+    Called from executor threads; the update is handed to the event loop.
+    """
+    job = _job_var.get()
+    if job is None or tv_key not in job['tvs']:
+        return
+    rate = done / elapsed if elapsed > 0 else None
+    job['_loop'].call_soon_threadsafe(
+        functools.partial(
+            _update_job_tv, job, tv_key,
+            done=done, total=total, failed=failed,
+            rate=round(rate, 1) if rate else None,
+            eta=round((total - done) / rate, 1) if rate else None,
+        )
+    )
+
+
+def _start_job(kind: str, targets: list, operation, summarize) -> dict:
+    """Run ``operation(target)`` for every TV as a background job.
+
+    Each TV's part holds that TV's operation lock, so it never interleaves
+    with the loop's uploads or another job on the same TV. When all parts
+    are done ``summarize(targets, results)`` becomes the job's ``result``.
+    """
+    job = {
+        'id': uuid.uuid4().hex[:12],
+        'kind': kind,
+        'status': 'queued',
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'finished': None,
+        'tvs': {t.key: {'state': 'waiting', 'done': 0, 'total': None, 'failed': 0, 'rate': None, 'eta': None} for t in targets},
+        'result': None,
+        '_loop': asyncio.get_running_loop(),
+        '_subscribers': set(),
+    }
+
+    async def _run_part(target: TVTarget):
+        async with _tv_op_lock(target.key):
+            _update_job_tv(job, target.key, state='running')
+            try:
+                return await operation(target)
+            except Exception as e:
+                logger.error(f'[JOB] {kind} {job["id"]} failed on {target.key}: {e}')
+                return {'success': False, 'message': f'Error: {e}'}
+            finally:
+                _update_job_tv(job, target.key, state='done', eta=None)
+
+    async def _run():
+        _job_var.set(job)
+        job['status'] = 'running'
+        _publish_job(job)
+        try:
+            results = await asyncio.gather(*(_run_part(t) for t in targets))
+            job['result'] = summarize(targets, results)
+        except Exception as e:
+            job['result'] = {'success': False, 'message': f'Error: {e}'}
+        finally:
+            job['status'] = 'finished'
+            job['finished'] = datetime.now().isoformat(timespec='seconds')
+            _publish_job(job)
+            logger.info(f'[JOB] {kind} {job["id"]} finished: {(job["result"] or {}).get("message")}')
+
+    _jobs[job['id']] = job
+    for job_id in list(_jobs):
+        if len(_jobs) <= _JOB_HISTORY_SIZE:
+            break
+        if _jobs[job_id]['status'] == 'finished':
+            del _jobs[job_id]
+    job['_task'] = asyncio.create_task(_run())
+    logger.info(f'[JOB] Started {kind} job {job["id"]} on {", ".join(job["tvs"])}')
+    return job
+
+
+async def _job_response(request, job: dict):
+    """Answer a job-starting request: 202 with the job's URLs, or with
+    ``?wait=1`` the job's result once it finishes."""
+    if request.query.get('wait', '').lower() in ('1', 'true', 'yes'):
+        await asyncio.shield(job['_task'])
+        return web.json_response(job['result'])
+    # Relative URLs so ingress-proxied clients resolve them under the add-on path
+    return web.json_response({
+        'success': True,
+        'job': job['id'],
+        'status': job['status'],
+        'status_url': f'jobs/{job["id"]}',
+        'events_url': f'jobs/{job["id"]}/events',
+        'message': f'{job["kind"]} started as job {job["id"]}',
+    }, status=202)
+
+
+async def handle_jobs(request):
+    """API endpoint: GET /jobs - Recent background jobs, newest first."""
+    return web.json_response({'jobs': [_job_view(job) for job in reversed(_jobs.values())]})
+
+
+async def handle_job(request):
+    """API endpoint: GET /jobs/{id} - Status, per-TV progress and result of a job."""
+    job = _jobs.get(request.match_info['job_id'])
+    if job is None:
+        return web.json_response({'success': False, 'message': 'Unknown job'}, status=404)
+    return web.json_response(_job_view(job))
+
+
+async def handle_job_events(request):
+    """API endpoint: GET /jobs/{id}/events - Server-Sent Events stream of job
+    progress; ends with an ``end`` event carrying the final state."""
+    job = _jobs.get(request.match_info['job_id'])
+    if job is None:
+        return web.json_response({'success': False, 'message': 'Unknown job'}, status=404)
+
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',  # keep proxies from buffering the stream
+    })
+    await response.prepare(request)
+    queue = asyncio.Queue()
+    job['_subscribers'].add(queue)
+    try:
+        view = _job_view(job)
+        while True:
+            event = 'end' if view['status'] == 'finished' else 'progress'
+            await response.write(f'event: {event}\ndata: {json.dumps(view)}\n\n'.encode())
+            if event == 'end':
+                break
+            try:
+                view = await asyncio.wait_for(queue.get(), timeout=15)
+            except asyncio.TimeoutError:
+                await response.write(b': keepalive\n\n')
+                view = _job_view(job)
+    except ConnectionResetError:
+        pass
+    finally:
+        job['_subscribers'].discard(queue)
+    return response
+
+
+def _cleanup_summary(targets: list, results: list) -> dict:
+    result = any(results)
+    return {
+        'success': result,
+        'message': 'Cleanup completed' if result else 'Cleanup attempted but no stale images found or cleanup failed',
+        'tvs': {t.key: r for t, r in zip(targets, results)},
+    }
+
+
 async def handle_cleanup(request):
-    """API endpoint: POST /cleanup - Manually cleanup stale images from TV."""
-    if not TV_IP:
+    """API endpoint: POST /cleanup - Manually cleanup stale images from TV(s).
+
+    Runs as a background job (202 + job URLs); ``?wait=1`` waits for the result.
+    """
+    targets = _requested_tv_targets(request)
+    if not targets:
         return web.json_response({
             'success': False,
-            'message': 'TV upload not configured (TV_IP not set)'
+            'message': 'TV upload not configured (TV_IP not set)' if not TV_TARGETS else 'Unknown TV'
         }, status=400)
     
     try:
         logger.info('[API] Manual cleanup requested')
-        result = await cleanup_stale_images_async(TV_IP, TV_PORT)
-        return web.json_response({
-            'success': result,
-            'message': 'Cleanup completed' if result else 'Cleanup attempted but no stale images found or cleanup failed'
-        })
+        job = _start_job('cleanup', targets, lambda t: cleanup_stale_images_async(t.host, t.port), _cleanup_summary)
+        return await _job_response(request, job)
     except Exception as e:
         logger.error(f'[API] Error during cleanup: {e}')
         return web.json_response({
@@ -962,88 +3748,133 @@ async def handle_cleanup(request):
         }, status=500)
 
 
-async def delete_all_art_async(host: str, port: int):
-    """Delete ALL art from TV (dangerous operation)."""
-    logger.warning('[TV DELETE-ALL] Starting deletion of ALL art from TV')
-    
-    try:
-        from samsungtvws import SamsungTVArt
-    except Exception as e:
-        logger.error(f'[TV DELETE-ALL] ERROR: samsungtvws library not available: {e}')
-        return {'success': False, 'deleted': 0, 'failed': 0, 'message': f'Library error: {e}'}
+async def handle_art(request):
+    """API endpoint: GET /art - Art this add-on owns on each TV and the last GC result."""
+    targets = _requested_tv_targets(request)
+    if not targets:
+        return web.json_response({
+            'success': False,
+            'message': 'TV upload not configured (TV_IP not set)' if not TV_TARGETS else 'Unknown TV'
+        }, status=400)
+    return web.json_response({
+        'success': True,
+        'tvs': {
+            t.key: {
+                'current': _read_last_art_id(t.host, t.port),
+                'owned': [{'id': cid, 'uploaded': uploaded} for cid, uploaded in _owned_art(t.key).items()],
+                'gc': _art_gc_status.get(t.key),
+            }
+            for t in targets
+        },
+    })
+
+
+def _art_gc_summary(targets: list, results: list) -> dict:
+    deleted = sum(len(r.get('deleted', [])) for r in results)
+    return {
+        'success': all(r.get('success') for r in results),
+        'message': f'Deleted {deleted} orphaned art entries',
+        'tvs': {t.key: r for t, r in zip(targets, results)},
+    }
+
+
+async def handle_art_gc(request):
+    """API endpoint: POST /art/gc - Reconcile owned art and delete orphans now.
+
+    Runs as a background job (202 + job URLs); ``?wait=1`` waits for the result.
+    """
+    targets = _requested_tv_targets(request)
+    if not targets:
+        return web.json_response({
+            'success': False,
+            'message': 'TV upload not configured (TV_IP not set)' if not TV_TARGETS else 'Unknown TV'
+        }, status=400)
+    logger.info('[API] Art reconciliation requested')
+    job = _start_job('art-gc', targets, _art_gc_target, _art_gc_summary)
+    return await _job_response(request, job)
+
+
+async def delete_all_art_async(host: str, port: int, owned_only: bool = False, older_than_days: float | None = None):
+    """Delete ALL art from TV (dangerous operation), or only the art this
+    add-on uploaded and/or art older than ``older_than_days``."""
+    tv_key = f'{host}:{port}'
+    selective = owned_only or older_than_days is not None
+    if selective:
+        logger.warning(f'[TV DELETE-ALL] Starting selective deletion of {"owned " if owned_only else ""}art'
+                       + (f' older than {older_than_days:g} days' if older_than_days is not None else '') + ' from TV')
+    else:
+        logger.warning('[TV DELETE-ALL] Starting deletion of ALL art from TV')
 
     def _sync_delete_all():
         """Synchronous delete-all function to run in executor."""
-        token_file = '/data/tv-token.txt'
-        tv = None
-        deleted_count = 0
-        failed_count = 0
         try:
-            logger.debug(f'[TV DELETE-ALL] Connecting to TV')
-            tv = SamsungTVArt(host=host, port=port, token_file=token_file)
-            tv.open()
+            with _tv_session(host, port) as tv:
+                if tv is None:
+                    logger.error('[TV DELETE-ALL] TV does not support art mode via this API')
+                    return {'success': False, 'deleted': 0, 'failed': 0, 'message': 'TV does not support art mode'}
 
-            supported = tv.supported()
-            if not supported:
-                logger.error('[TV DELETE-ALL] TV does not support art mode via this API')
-                tv.close()
-                return {'success': False, 'deleted': 0, 'failed': 0, 'message': 'TV does not support art mode'}
+                # Get list of all art
+                try:
+                    art_list = tv.available()
+                except Exception as e:
+                    logger.error(f'[TV DELETE-ALL] Error retrieving art list: {e}')
+                    return {'success': False, 'deleted': 0, 'failed': 0, 'message': f'Error getting art list: {e}'}
 
-            # Get list of all art
-            try:
-                art_list = tv.get_artlist()
                 logger.info(f'[TV DELETE-ALL] Found {len(art_list)} total art entries on TV')
-                
+                owned = _owned_art(tv_key)
+                cutoff = datetime.now() - timedelta(days=older_than_days) if older_than_days is not None else None
+                content_ids = []
                 for art in art_list:
                     content_id = art.get('content_id')
-                    if content_id:
-                        try:
-                            logger.debug(f'[TV DELETE-ALL] Deleting: {content_id}')
-                            tv.delete(content_id)
-                            deleted_count += 1
-                        except Exception as e:
-                            logger.warning(f'[TV DELETE-ALL] Failed to delete {content_id}: {e}')
-                            failed_count += 1
-                
-            except Exception as e:
-                logger.error(f'[TV DELETE-ALL] Error retrieving art list: {e}')
-                tv.close()
-                return {'success': False, 'deleted': 0, 'failed': 0, 'message': f'Error getting art list: {e}'}
+                    if not content_id or (owned_only and content_id not in owned):
+                        continue
+                    if cutoff is not None:
+                        added = _art_item_time(art, owned)
+                        if added is None or added >= cutoff:
+                            continue  # unknown age counts as recent
+                    content_ids.append(content_id)
+                if selective:
+                    logger.info(f'[TV DELETE-ALL] {len(content_ids)} art entries match the selection')
 
-            tv.close()
-            logger.info(f'[TV DELETE-ALL] Deletion complete: {deleted_count} deleted, {failed_count} failed')
+                start = time.monotonic()
+                deleted_ids, failed_ids = _delete_art_chunked(tv, content_ids, tv_key, '[TV DELETE-ALL]') if content_ids else ([], [])
+                duration = time.monotonic() - start
+
+            logger.info(f'[TV DELETE-ALL] Deletion complete: {len(deleted_ids)} deleted, {len(failed_ids)} failed in {duration:.1f}s')
             
             # Clear the cached ID file
             try:
-                if os.path.exists(TV_LAST_ART_FILE):
-                    os.remove(TV_LAST_ART_FILE)
-                if os.path.exists(TV_DELETION_RETRY_FILE):
-                    os.remove(TV_DELETION_RETRY_FILE)
+                if _read_last_art_id(host, port) in deleted_ids:
+                    _clear_last_art_id(host, port)
+                if selective:
+                    for content_id in deleted_ids:
+                        _clear_deletion_retry(tv_key, content_id)
+                else:
+                    _clear_deletion_retry(tv_key)
+                if deleted_ids:
+                    _forget_owned_art(tv_key, *deleted_ids)
                 logger.debug('[TV DELETE-ALL] Cleared cached art ID files')
             except Exception:
                 pass
             
             return {
                 'success': True,
-                'deleted': deleted_count,
-                'failed': failed_count,
-                'message': f'Successfully deleted {deleted_count} art entries' + (f' ({failed_count} failed)' if failed_count > 0 else '')
+                'deleted': len(deleted_ids),
+                'failed': len(failed_ids),
+                'matched': len(content_ids),
+                'duration': round(duration, 3),
+                'rate': round(len(deleted_ids) / duration, 1) if duration > 0 else None,
+                'message': f'Successfully deleted {len(deleted_ids)} art entries' + (f' ({len(failed_ids)} failed)' if failed_ids else '')
             }
             
         except Exception as e:
             logger.error(f'[TV DELETE-ALL] ERROR: Exception during delete-all: {e}')
-            try:
-                if tv:
-                    tv.close()
-            except Exception:
-                pass
             return {'success': False, 'deleted': 0, 'failed': 0, 'message': f'Error: {e}'}
 
     # Run sync delete-all in thread executor with timeout
-    loop = asyncio.get_event_loop()
     try:
         return await asyncio.wait_for(
-            loop.run_in_executor(None, _sync_delete_all),
+            _run_in_executor(_sync_delete_all),
             timeout=TV_UPLOAD_TIMEOUT * 5  # Give more time for bulk delete
         )
     except asyncio.TimeoutError:
@@ -1051,18 +3882,53 @@ async def delete_all_art_async(host: str, port: int):
         return {'success': False, 'deleted': 0, 'failed': 0, 'message': f'Operation timed out after {TV_UPLOAD_TIMEOUT * 5}s'}
 
 
+def _delete_all_summary(targets: list, results: list) -> dict:
+    if len(results) == 1:
+        result = dict(results[0])
+    else:
+        result = {
+            'success': all(r['success'] for r in results),
+            'deleted': sum(r.get('deleted', 0) for r in results),
+            'failed': sum(r.get('failed', 0) for r in results),
+            'message': '; '.join(f"{t.key}: {r['message']}" for t, r in zip(targets, results)),
+        }
+    result['tvs'] = {t.key: r for t, r in zip(targets, results)}
+    return result
+
+
 async def handle_delete_all(request):
-    """API endpoint: POST /delete-all - Delete ALL art from TV (dangerous!)."""
-    if not TV_IP:
+    """API endpoint: POST /delete-all - Delete ALL art from TV(s) (dangerous!).
+
+    ``?owned=1`` limits it to art this add-on uploaded and
+    ``?older_than_days=N`` to art added more than N days ago. Runs as a
+    background job (202 + job URLs); ``?wait=1`` waits for the result.
+    """
+    targets = _requested_tv_targets(request)
+    if not targets:
         return web.json_response({
             'success': False,
-            'message': 'TV upload not configured (TV_IP not set)'
+            'message': 'TV upload not configured (TV_IP not set)' if not TV_TARGETS else 'Unknown TV'
         }, status=400)
     
+    owned_only = request.query.get('owned', '').lower() in ('1', 'true', 'yes')
+    older_than_days = None
+    if request.query.get('older_than_days'):
+        try:
+            older_than_days = float(request.query['older_than_days'])
+        except ValueError:
+            return web.json_response({'success': False, 'message': 'older_than_days must be a number'}, status=400)
+
     try:
-        logger.warning('[API] DELETE-ALL requested - removing all art from TV')
-        result = await delete_all_art_async(TV_IP, TV_PORT)
-        return web.json_response(result)
+        if owned_only or older_than_days is not None:
+            logger.warning('[API] Selective DELETE-ALL requested')
+        else:
+            logger.warning('[API] DELETE-ALL requested - removing all art from TV')
+        job = _start_job(
+            'delete-all', targets,
+            lambda t: delete_all_art_async(t.host, t.port, owned_only, older_than_days),
+            _delete_all_summary,
+        )
+        return await _job_response(request, job)
     except Exception as e:
         logger.error(f'[API] Error during delete-all: {e}')
         return web.json_response({
@@ -1262,14 +4128,42 @@ async def handle_dashboard(request):
                 document.getElementById('error-status').textContent = status.error || 'None';
             }
 
+            // Follow a background job's event stream; resolves with its result
+            async function runJob(path, btn, label) {
+                const response = await fetch(path, { method: 'POST' });
+                const started = await response.json();
+                if (!started.job) {
+                    return started;
+                }
+                return await new Promise((resolve, reject) => {
+                    const events = new EventSource(started.events_url);
+                    events.addEventListener('progress', (e) => {
+                        const job = JSON.parse(e.data);
+                        const parts = Object.values(job.tvs).filter(tv => tv.total);
+                        const done = parts.reduce((n, tv) => n + tv.done, 0);
+                        const total = parts.reduce((n, tv) => n + tv.total, 0);
+                        const eta = Math.max(0, ...parts.map(tv => tv.eta || 0));
+                        btn.innerHTML = '<span class="spinner"></span>' + label +
+                            (total ? ` ${done}/${total}` + (eta ? ` (~${Math.ceil(eta)}s left)` : '') : '');
+                    });
+                    events.addEventListener('end', (e) => {
+                        events.close();
+                        resolve(JSON.parse(e.data).result);
+                    });
+                    events.onerror = () => {
+                        events.close();
+                        reject(new Error('Lost connection to job ' + started.job));
+                    };
+                });
+            }
+
             async function cleanup() {
                 const btn = event.target;
                 btn.disabled = true;
                 btn.innerHTML = '<span class="spinner"></span>Cleaning up...';
                 
                 try {
-                    const response = await fetch('cleanup', { method: 'POST' });
-                    const result = await response.json();
+                    const result = await runJob('cleanup', btn, 'Cleaning up...');
                     
                     if (result.success) {
                         showResult(result.message, 'success');
@@ -1298,8 +4192,7 @@ async def handle_dashboard(request):
                 btn.innerHTML = '<span class="spinner"></span>Deleting all art...';
                 
                 try {
-                    const response = await fetch('delete-all', { method: 'POST' });
-                    const result = await response.json();
+                    const result = await runJob('delete-all', btn, 'Deleting all art...');
                     
                     if (result.success) {
                         showResult(
@@ -1369,9 +4262,16 @@ async def start_api_server():
     app = web.Application(middlewares=[_ingress_middleware])
     app.router.add_get('/', handle_dashboard)
     app.router.add_get('/status', handle_status)
+    app.router.add_get('/status/history', handle_status_history)
+    app.router.add_get('/metrics', handle_metrics)
     app.router.add_get('/screenshot', handle_screenshot)
     app.router.add_post('/cleanup', handle_cleanup)
     app.router.add_post('/delete-all', handle_delete_all)
+    app.router.add_get('/art', handle_art)
+    app.router.add_post('/art/gc', handle_art_gc)
+    app.router.add_get('/jobs', handle_jobs)
+    app.router.add_get('/jobs/{job_id}', handle_job)
+    app.router.add_get('/jobs/{job_id}/events', handle_job_events)
     
     runner = web.AppRunner(app)
     await runner.setup()
@@ -1387,49 +4287,99 @@ async def start_api_server():
     logger.info(f'[API] Web server started on port {api_port}')
     logger.info(f'[API]   GET http://localhost:{api_port}/ - Control dashboard')
     logger.info(f'[API]   GET http://localhost:{api_port}/status - Sync status (JSON)')
+    logger.info(f'[API]   GET http://localhost:{api_port}/status/history?limit=N - Recent cycle traces (JSON)')
+    logger.info(f'[API]   GET http://localhost:{api_port}/metrics - Prometheus metrics')
     logger.info(f'[API]   GET http://localhost:{api_port}/screenshot - Current screenshot image')
     logger.info(f'[API]   POST http://localhost:{api_port}/cleanup - Manually cleanup stale images from TV')
-    logger.info(f'[API]   POST http://localhost:{api_port}/delete-all - Delete ALL art from TV')
+    logger.info(f'[API]   POST http://localhost:{api_port}/delete-all[?owned=1&older_than_days=N] - Delete ALL (or selected) art from TV')
+    logger.info(f'[API]   GET http://localhost:{api_port}/art - Art uploaded by this add-on per TV (JSON)')
+    logger.info(f'[API]   POST http://localhost:{api_port}/art/gc - Delete orphaned uploads from TV now')
+    logger.info(f'[API]   GET http://localhost:{api_port}/jobs/<id>[/events] - Background cleanup/delete-all job status (JSON or SSE)')
     
     return runner
 
 
+async def _prelaunch_browser():
+    """Launch Chromium and open a pooled page per target ahead of the first cycle.
+
+    Only pages are created (navigation is the first cycle's job), so a target
+    that turns out to be a plain image costs an idle page, not a load.
+    """
+    urls = [url for url in _render_urls() if _target_kinds.get(url) != 'image']
+    if not urls:
+        return
+    for url in urls[:BROWSER_PAGE_POOL_SIZE]:
+        await _acquire_page(url, SCREENSHOT_WIDTH, SCREENSHOT_HEIGHT)
+
+
 async def async_main():
     global _main_loop
     logger.debug('[STARTUP] Starting screenshot loop...')
 
     loop = asyncio.get_running_loop()
     _main_loop = loop  # Store for MQTT callbacks
-    
-    # Initialize MQTT if enabled
-    await _mqtt_connect()
-    
-    # Attempt to cleanup any stale images from previous failed uploads on startup
-    if TV_IP:
-        logger.info('[STARTUP] Attempting to cleanup any stale images from previous runs...')
+
+    startup_started = time.monotonic()
+
+    def _log_phase(name: str, started: float):
+        now = time.monotonic()
+        logger.info(f'[STARTUP] {name} finished in {now - started:.2f}s (+{now - startup_started:.2f}s since start)')
+
+    async def _phase(name: str, coro):
+        """Run a background startup phase, logging its duration and any failure."""
+        started = time.monotonic()
         try:
-            cleanup_success = await cleanup_stale_images_async(TV_IP, TV_PORT)
-            if cleanup_success:
-                logger.info('[STARTUP] ✓ Stale image cleanup completed successfully')
-            else:
-                logger.debug('[STARTUP] No stale images found or cleanup not needed')
+            return await coro
         except Exception as e:
-            logger.warning(f'[STARTUP] Warning: Cleanup attempt failed: {e}')
-    
-    screenshot_task = loop.create_task(screenshot_loop())
+            logger.warning(f'[STARTUP] {name} failed: {e}')
+        finally:
+            _log_phase(name, started)
+
+    # Serve the previous run's frame until a new one is rendered, and bring the API up first
+    started = time.monotonic()
+    await asyncio.gather(_load_persisted_frame(), _load_trace_history())
+    _log_phase('restore state', started)
+    started = time.monotonic()
     api_runner = await start_api_server()
+    _log_phase('API server', started)
+
+    # Everything else overlaps: MQTT connects in the background, stale art is
+    # cleaned up per TV (each TV's first upload waits for its own cleanup) and
+    # Chromium is launched while the first cycle probes its targets
+    background = [
+        loop.create_task(_phase('MQTT connect', _mqtt_connect())),
+        loop.create_task(_phase('browser pre-launch', _prelaunch_browser())),
+    ]
+    for target in TV_TARGETS:
+        _startup_cleanups[target.key] = loop.create_task(
+            _phase(f'stale art cleanup on {target.key}', cleanup_stale_images_async(target.host, target.port))
+        )
+
+    screenshot_task = loop.create_task(screenshot_loop())
+    upload_task = loop.create_task(tv_upload_worker())
+    trigger_task = loop.create_task(ha_trigger_listener())
     try:
         await asyncio.Event().wait()  # run indefinitely until cancelled/interrupt
     finally:
         logger.info('[SHUTDOWN] Shutting down gracefully...')
-        screenshot_task.cancel()
-        try:
-            await screenshot_task
-        except asyncio.CancelledError:
-            pass
+        jobs = [job['_task'] for job in _jobs.values() if not job['_task'].done()]
+        for task in (screenshot_task, upload_task, trigger_task, *background, *_startup_cleanups.values(), *jobs):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         
         # Disconnect MQTT
         await _mqtt_disconnect()
+
+        # Close pooled HTTP connections
+        await _close_http_session()
+        _shutdown_image_pool()
+
+        # Close persistent TV connections
+        await _reset_tv_connections()
+        _state.close()
         
         # Clean up API server
         try:
@@ -1439,13 +4389,10 @@ async def async_main():
             pass
         
         # Clean up persistent browser
-        global _browser, _page
-        if _page:
-            try:
-                await _page.close()
-                logger.debug('[SHUTDOWN] Closed browser page')
-            except Exception:
-                pass
+        for entry in list(_pages.values()):
+            await _close_page_entry(entry)
+        _pages.clear()
+        logger.debug('[SHUTDOWN] Closed browser pages')
         if _browser:
             try:
                 await _browser.close()
@@ -12,13 +12,14 @@ fi
 if [ -f /data/options.json ]; then
   eval "$(python - <<'PY'
 import json
+import shlex
 opts = json.load(open('/data/options.json'))
 for k,v in opts.items():
     key = k.upper()
-    # escape double quotes
     if isinstance(v, bool):
         v = str(v).lower()
-    print(f'export {key}="{v}"')
+    # quote values so JSON options (target_headers, tv_targets) survive eval
+    print(f'export {key}={shlex.quote(str(v))}')
 PY
 )"
 fi